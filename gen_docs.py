@@ -1,28 +1,80 @@
 """generate docs for inovopy"""
+import os
+import errno
+import filecmp
 import subprocess
 import shutil
+import threading
+from typing import IO, Callable
 from inovopy.logger import Logger
 
+def _drain(stream: IO[str], log: Callable[[str], None]):
+    """log every line of a stream until it is closed"""
+    for stdline in iter(stream.readline, ''):
+        stdline = stdline.rstrip('\n')
+        if stdline:
+            log(stdline)
+    stream.close()
+
+def _sync_tree(src: str, dst: str, logger: Logger):
+    """
+    make `dst` identical to `src`,
+    only files that are new or whose content changed are moved over,
+    `src` is consumed in the process
+    """
+    kept : set[str] = set()
+    for root, _, files in os.walk(src):
+        for file in files:
+            rel = os.path.relpath(os.path.join(root, file), src)
+            kept.add(rel)
+            src_file, dst_file = os.path.join(src, rel), os.path.join(dst, rel)
+            if os.path.isfile(dst_file) and filecmp.cmp(src_file, dst_file, shallow=False):
+                continue
+            logger.debug(f"updating {dst_file}")
+            os.makedirs(os.path.dirname(dst_file), exist_ok=True)
+            try:
+                os.replace(src_file, dst_file)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.copyfile(src_file, dst_file)
+
+    for root, _, files in os.walk(dst):
+        for file in files:
+            dst_file = os.path.join(root, file)
+            if os.path.relpath(dst_file, dst) not in kept:
+                logger.debug(f"removing {dst_file}")
+                os.remove(dst_file)
+
 def gen_docs():
     """generate docs for inovopy"""
     logger = Logger.default("Gen-Docs")
 
-    logger.info("Removing old /docs . . .")
-    shutil.rmtree("./docs", ignore_errors=True)
-
-    res = subprocess.run(
-        ["pdoc","--html","inovopy", "--force"], capture_output=True, text=True, check=False)
+    with subprocess.Popen(
+            ["pdoc","--html","inovopy", "--force"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1) as proc:
+        stderr_lines : list[str] = []
+        def log_stderr(stdline: str):
+            stderr_lines.append(stdline)
+            logger.error(stdline)
 
-    for stdline in res.stdout.split('\n'):
-        if stdline:
-            logger.info(f"pdoc -- {stdline}")
+        drains = [
+            threading.Thread(
+                target=_drain, args=(proc.stdout, lambda l: logger.info(f"pdoc -- {l}"))),
+            threading.Thread(
+                target=_drain, args=(proc.stderr, log_stderr)),
+        ]
+        for drain in drains:
+            drain.start()
+        for drain in drains:
+            drain.join()
+        proc.wait()
 
-    if res.stderr != "":
-        logger.error(res.stderr)
+    if stderr_lines:
         return
 
-    logger.info("moving from /html/inovopy to /docs")
-    shutil.copytree("./html/inovopy", "./docs")
+    logger.info("moving changed files from /html/inovopy to /docs")
+    _sync_tree("./html/inovopy", "./docs", logger)
 
     logger.info("Removing /html . . .")
     shutil.rmtree("./html", ignore_errors=True)
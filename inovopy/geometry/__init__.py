@@ -6,15 +6,28 @@ This module provide geometric data structure class for robot control
 - `transform` : Functions and Class for 3D spatial transform
 - `jointcoord` : 6D joint space representation
 """
-from abc import ABC,abstractmethod
+import math
 
 from inovopy.iva import  MotionMode, RobotCommand
 
-class IntoRobotCommand(ABC):
+_PI : float = math.pi
+_D2R : float = _PI / 180.0
+"""factor from degree to radian"""
+_R2D : float = 180.0 / _PI
+"""factor from radian to degree"""
+
+_M_LIN = MotionMode.LINEAR
+_M_LINR = MotionMode.LINEAR_RELATIVE
+_M_JNT = MotionMode.JOINT
+_M_JNTR = MotionMode.JOINT_RELATIVE
+
+class IntoRobotCommand:
     """
     # IntoRobotCommand
     An interface for all class that can be turn into robot command
 
+    implementor only need to provide `to_dict`
+
     ## Method
     - `as_motion`
     - `as_linear`
@@ -22,23 +35,20 @@ class IntoRobotCommand(ABC):
     - `as_joint`
     - `as_joint_relative`
     """
-    #@abstractmethod
+    __slots__ = ()
+
     def as_motion(self, motion_mode: MotionMode) -> RobotCommand:
         """construct a new motion command from the `self`"""
         return RobotCommand.motion(motion_mode=motion_mode, target=self)
-    #@abstractmethod
     def as_linear(self) -> RobotCommand:
         """construct a new linear motion command from the `self`"""
-        return self.as_motion(motion_mode=MotionMode.LINEAR)
-    #@abstractmethod
+        return self.as_motion(motion_mode=_M_LIN)
     def as_linear_relative(self) -> RobotCommand:
         """construct a new linear relative motion command from the `self`"""
-        return self.as_motion(motion_mode=MotionMode.LINEAR_RELATIVE)
-    #@abstractmethod
+        return self.as_motion(motion_mode=_M_LINR)
     def as_joint(self) -> RobotCommand:
         """construct a new joint motion command from the `self`"""
-        return self.as_motion(motion_mode=MotionMode.JOINT)
-    #@abstractmethod
+        return self.as_motion(motion_mode=_M_JNT)
     def as_joint_relative(self) -> RobotCommand:
         """construct a new joint relative motion command from the `self`"""
-        return self.as_motion(motion_mode=MotionMode.JOINT_RELATIVE)
+        return self.as_motion(motion_mode=_M_JNTR)
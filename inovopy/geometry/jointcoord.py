@@ -5,15 +5,25 @@ This module provide joint space representation class for joint space
 ## Class
 - `JointCoord` : 6D joint space representation
 """
-import re
-from inovopy.geometry import IntoRobotCommand
-from inovopy.geometry.transform import rad_to_deg
+import numpy
+import numpy.typing as numpy_typing
+
+from inovopy.geometry import IntoRobotCommand, _R2D
+
+_LB = "["
+_RB = "]"
+_JKEYS = ("j1", "j2", "j3", "j4", "j5", "j6")
 
 class JointCoord(IntoRobotCommand):
     """
     # JointCoord
     A class representing 6D joint space of robot
+
+    ## Representation
+    - `joint_coord_deg` : a `numpy` array of shape `(6,)` with unit in degree
     """
+    __slots__ = ("joint_coord_deg",)
+
     def __init__(
             self,
             j1_deg : float = 0,
@@ -26,17 +36,50 @@ class JointCoord(IntoRobotCommand):
         """
         Construct a new joint space representation from all joint angle
         """
-        self.joint_coord_deg : list[float]= [j1_deg,j2_deg,j3_deg,j4_deg,j5_deg,j6_deg]
+        self.joint_coord_deg : numpy_typing.NDArray[numpy.float64] = \
+            numpy.array([j1_deg,j2_deg,j3_deg,j4_deg,j5_deg,j6_deg], dtype=numpy.float64)
 
     def __str__(self) -> str:
-        return f"<JointCoord {[ f'{q:>5.1}' for q in self.joint_coord_deg]}>"
+        joints = numpy.array2string(self.joint_coord_deg, precision=1, suppress_small=True)
+        return f"<JointCoord {joints}>"
 
-    def __add__(self, rhs : 'JointCoord') -> 'JointCoord':
-        out = JointCoord()
-        out.joint_coord_deg = [(self[i] + rhs[i]) for i in range(6)]
+    @classmethod
+    def _from_array(cls, joint_coord_deg: numpy_typing.NDArray[numpy.float64]) -> 'JointCoord':
+        """wrap an array of shape `(6,)` as a new `JointCoord` without copying it"""
+        out = cls.__new__(cls)
+        out.joint_coord_deg = joint_coord_deg
         return out
+
+    def __add__(self, rhs : 'JointCoord') -> 'JointCoord':
+        return type(self)._from_array(self.joint_coord_deg + rhs.joint_coord_deg)
+    def __neg__(self) -> 'JointCoord':
+        return type(self)._from_array(-self.joint_coord_deg)
+    def __mul__(self, rhs : float) -> 'JointCoord':
+        return type(self)._from_array(self.joint_coord_deg * rhs)
+    def __rmul__(self, lhs : float) -> 'JointCoord':
+        return self * lhs
     def __getitem__(self, idx: int) -> float:
-        return self.joint_coord_deg[idx]
+        return float(self.joint_coord_deg[idx])
+    def __eq__(self, rhs: object) -> bool:
+        return isinstance(rhs, JointCoord) \
+            and numpy.array_equal(self.joint_coord_deg, rhs.joint_coord_deg)
+    def __hash__(self) -> int:
+        return hash(tuple(self.joint_coord_deg.tolist()))
+
+    @classmethod
+    def from_list(cls, coord: list[float]) -> 'JointCoord':
+        """
+        Construct a new `JointCoord` from a list of joint angle in degree
+
+        ## Parameter
+        - `coord : list[float]` : joint angles, only the first 6 are used
+
+        ## Exception
+        `ValueError` : if less than 6 joint angles are given
+        """
+        if len(coord) < 6:
+            raise ValueError(f"Expect 6 joint angles, but recieve {len(coord)}")
+        return cls._from_array(numpy.asarray(coord[:6], dtype=numpy.float64))
 
     @classmethod
     def from_robot(cls, res: str) -> 'JointCoord':
@@ -50,78 +93,81 @@ class JointCoord(IntoRobotCommand):
         x : -0.073378, y : -0.014815, z : 0.929764, }, 
         tcpid : tool_plate, }`
         """
-        res = re.findall(r"\[.*\]",res)[0]
-        res = re.sub(r"[ \[\]]","",res).split(",")
-        joints : list[float] = []
-        for i in range(6):
+        start = res.index(_LB)
+        end = res.index(_RB, start)
+        parts = res[start+1:end].split(",")
+
+        joints = numpy.zeros(6, dtype=numpy.float64)
+        for i, part in enumerate(parts[:6]):
             try:
-                joints.append(rad_to_deg(float(res[i])))
-            except (ValueError, IndexError):
-                joints.append(0)
-        return JointCoord(
-            joints[0],
-            joints[1],
-            joints[2],
-            joints[3],
-            joints[4],
-            joints[5],
-        )
+                joints[i] = float(part)
+            except ValueError:
+                pass
+
+        return cls._from_array(joints * _R2D)
+
+    @classmethod
+    def _from_j(cls, i: int, deg: float) -> 'JointCoord':
+        """Construct a new `JointCoord` with only joint `i` (0-indexed) specified"""
+        joints = numpy.zeros(6, dtype=numpy.float64)
+        joints[i] = deg
+        return cls._from_array(joints)
+
+    def _then_j(self, i: int, deg: float) -> 'JointCoord':
+        """Return a new `JointCoord` by rotating joint `i` (0-indexed)"""
+        joints = self.joint_coord_deg.copy()
+        joints[i] += deg
+        return type(self)._from_array(joints)
 
     @classmethod
     def from_j1(cls, deg: float = 0)->'JointCoord':
         """Construct a new `JointCoord` with specified joint 1"""
-        return JointCoord(j1_deg=deg)
+        return cls._from_j(0, deg)
     @classmethod
     def from_j2(cls, deg: float = 0)->'JointCoord':
         """Construct a new `JointCoord` with specified joint 2"""
-        return JointCoord(j1_deg=deg)
+        return cls._from_j(1, deg)
     @classmethod
     def from_j3(cls, deg: float = 0)->'JointCoord':
         """Construct a new `JointCoord` with specified joint 3"""
-        return JointCoord(j1_deg=deg)
+        return cls._from_j(2, deg)
     @classmethod
     def from_j4(cls, deg: float = 0)->'JointCoord':
         """Construct a new `JointCoord` with specified joint 4"""
-        return JointCoord(j1_deg=deg)
+        return cls._from_j(3, deg)
     @classmethod
     def from_j5(cls, deg: float = 0)->'JointCoord':
         """Construct a new `JointCoord` with specified joint 5"""
-        return JointCoord(j1_deg=deg)
+        return cls._from_j(4, deg)
     @classmethod
     def from_j6(cls, deg: float = 0)->'JointCoord':
         """Construct a new `JointCoord` with specified joint 6"""
-        return JointCoord(j1_deg=deg)
+        return cls._from_j(5, deg)
 
     def then_j1(self, deg: float = 0) -> 'JointCoord':
         """Return a new `JointCoord` with a by roating joint 1"""
-        return self + JointCoord.from_j1(deg)
+        return self._then_j(0, deg)
     def then_j2(self, deg: float = 0) -> 'JointCoord':
         """Return a new `JointCoord` with a by roating joint 2"""
-        return self + JointCoord.from_j2(deg)
+        return self._then_j(1, deg)
     def then_j3(self, deg: float = 0) -> 'JointCoord':
         """Return a new `JointCoord` with a by roating joint 3"""
-        return self + JointCoord.from_j3(deg)
+        return self._then_j(2, deg)
     def then_j4(self, deg: float = 0) -> 'JointCoord':
         """Return a new `JointCoord` with a by roating joint 4"""
-        return self + JointCoord.from_j4(deg)
+        return self._then_j(3, deg)
     def then_j5(self, deg: float = 0) -> 'JointCoord':
         """Return a new `JointCoord` with a by roating joint 5"""
-        return self + JointCoord.from_j5(deg)
+        return self._then_j(4, deg)
     def then_j6(self, deg: float = 0) -> 'JointCoord':
         """Return a new `JointCoord` with a by roating joint 6"""
-        return self + JointCoord.from_j6(deg)
+        return self._then_j(5, deg)
 
     def to_dict(self) -> dict[str, str|float]:
         """return a `dict[str,str|float]` representation of the `JointCoord`"""
-        return {
-            "target" : "joint_coord",
-            "j1" : self.joint_coord_deg[0],
-            "j2" : self.joint_coord_deg[1],
-            "j3" : self.joint_coord_deg[2],
-            "j4" : self.joint_coord_deg[3],
-            "j5" : self.joint_coord_deg[4],
-            "j6" : self.joint_coord_deg[5],
-        }
+        d : dict[str, str|float] = {"target" : "joint_coord"}
+        d.update(zip(_JKEYS, self.joint_coord_deg.tolist()))
+        return d
 
     @classmethod
     def from_dict(cls, data: dict[str, str|float]) -> 'JointCoord':
@@ -131,10 +177,4 @@ class JointCoord(IntoRobotCommand):
         ## Parameter
         - `data: dict[str, str|float]`: the data, if field is missing, 0 will be assumed
         """
-        j1 = 0 if "j1" not in data else data["j1"]
-        j2 = 0 if "j2" not in data else data["j2"]
-        j3 = 0 if "j3" not in data else data["j3"]
-        j4 = 0 if "j4" not in data else data["j4"]
-        j5 = 0 if "j5" not in data else data["j5"]
-        j6 = 0 if "j6" not in data else data["j6"]
-        return JointCoord(j1, j2, j3, j4, j5, j6)
+        return cls(*(float(data.get(k, 0)) for k in _JKEYS))
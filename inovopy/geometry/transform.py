@@ -4,6 +4,7 @@ This module provide useful class and function for spatial calculation
 
 ## Class 
 - `Transform` : A spatial transform represented a translation and rotation
+- `BatchTransform` : Many spatial transform stored as arrays, for vectorized calculation
 
 ## Function
 - `deg_to_rad` : translate degree to radian
@@ -13,73 +14,187 @@ This module provide useful class and function for spatial calculation
 - `rz_mat` : compute rotation matrx of rotation along z axis
 - `euler_to_mat` : translate euler angle to rotation matrix
 - `mat_to_euler` : translate rotation matrix to euler angle
+
+## Variable
+- `DTYPE` : dtype of the matrix returned by this module, `numpy.float64` by default
 """
-from typing import Tuple
+from typing import Tuple, cast
+from math import cos as _cos, sin as _sin, asin as _asin, atan2 as _atan2, sqrt as _sqrt
+import math
 import re
 
 import numpy
 import numpy.typing as numpy_typing
-
-from inovopy.geometry import IntoRobotCommand
+from numpy import array as _array
+
+from inovopy.geometry import IntoRobotCommand, _D2R, _R2D
+
+_ROBOT_RE = re.compile(
+    r"\b(rx|ry|rz|x|y|z)\s*:\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)")
+"""pattern of a `key : value` field in robot transform response"""
+_ROBOT_SCALE : dict[str, float] = {
+    "x" : 1000, "y" : 1000, "z" : 1000, "rx" : _R2D, "ry" : _R2D, "rz" : _R2D
+}
+"""scale of each field from robot unit (m, rad) to `Transform` unit (mm, deg)"""
+DTYPE : type = numpy.float64
+"""
+dtype of the matrix returned by `rx_mat`, `ry_mat`, `rz_mat`, `euler_to_mat`,
+and `to_homogenous`, may be set to `numpy.float32` to halve their size,
+calculation between `Transform` is not affected
+"""
+_Mat = numpy_typing.NDArray[numpy.floating]
+"""matrix returned by this module, its dtype follow `DTYPE`"""
+_HALF_PI = math.pi / 2
+_GIMBAL_LIMIT = 1.0 - 1e-12
+"""`abs(r31)` at or above which `ry` is treated as +-90 degree (gimbal lock)"""
 
 def deg_to_rad(deg:float) -> float:
     """translate degree to radian"""
-    return deg / 180 * numpy.pi
+    return deg * _D2R
 
 def rad_to_deg(rad:float) -> float:
     """translate radion to degree"""
-    return rad / numpy.pi * 180
+    return rad * _R2D
 
-def rx_mat(deg: float) -> numpy_typing.NDArray[numpy.float64]:
+def rx_mat(deg: float) -> _Mat:
     """compute rotation matrx of rotation along x axis"""
-    mat = numpy.eye(3)
-    mat[1,1] = numpy.cos(deg_to_rad(deg))
-    mat[1,2] = -numpy.sin(deg_to_rad(deg))
-    mat[2,2] = numpy.cos(deg_to_rad(deg))
-    mat[2,1] = numpy.sin(deg_to_rad(deg))
-    return mat
-
-def ry_mat(deg: float) -> numpy_typing.NDArray[numpy.float64]:
+    rad = deg * _D2R
+    c, s = _cos(rad), _sin(rad)
+    return _array([
+        [1.0, 0.0, 0.0],
+        [0.0,   c,  -s],
+        [0.0,   s,   c],
+    ], dtype=DTYPE)
+
+def ry_mat(deg: float) -> _Mat:
     """compute rotation matrx of rotation along y axis"""
-    mat = numpy.eye(3)
-    mat[0,0] = numpy.cos(deg_to_rad(deg))
-    mat[0,2] = numpy.sin(deg_to_rad(deg))
-    mat[2,2] = numpy.cos(deg_to_rad(deg))
-    mat[2,0] = -numpy.sin(deg_to_rad(deg))
-    return mat
-
-def rz_mat(deg: float) -> numpy_typing.NDArray[numpy.float64]:
+    rad = deg * _D2R
+    c, s = _cos(rad), _sin(rad)
+    return _array([
+        [  c, 0.0,   s],
+        [0.0, 1.0, 0.0],
+        [ -s, 0.0,   c],
+    ], dtype=DTYPE)
+
+def rz_mat(deg: float) -> _Mat:
     """compute rotation matrx of rotation along z axis"""
-    mat = numpy.eye(3)
-    mat[0,0] = numpy.cos(deg_to_rad(deg))
-    mat[0,1] = -numpy.sin(deg_to_rad(deg))
-    mat[1,1] = numpy.cos(deg_to_rad(deg))
-    mat[1,0] = numpy.sin(deg_to_rad(deg))
-    return mat
-
-def euler_to_mat(euler_deg: Tuple[float, float, float]) -> numpy_typing.NDArray[numpy.float64]:
+    rad = deg * _D2R
+    c, s = _cos(rad), _sin(rad)
+    return _array([
+        [  c,  -s, 0.0],
+        [  s,   c, 0.0],
+        [0.0, 0.0, 1.0],
+    ], dtype=DTYPE)
+
+def _rotation_entries(euler_deg: Tuple[float, float, float]) -> Tuple[float, ...]:
+    """
+    entries of the rotation matrix of euler angle in row major order,
+    computed in closed form of `rz_mat @ ry_mat @ rx_mat`
+    """
+    rx, ry, rz = euler_deg[0] * _D2R, euler_deg[1] * _D2R, euler_deg[2] * _D2R
+    cx, sx = _cos(rx), _sin(rx)
+    cy, sy = _cos(ry), _sin(ry)
+    cz, sz = _cos(rz), _sin(rz)
+    return (
+        cy*cz, sx*sy*cz - cx*sz, cx*sy*cz + sx*sz,
+        cy*sz, sx*sy*sz + cx*cz, cx*sy*sz - sx*cz,
+          -sy,            sx*cy,            cx*cy,
+    )
+
+def euler_to_mat(euler_deg: Tuple[float, float, float]) -> _Mat:
     """translate euler angle to rotation matrix"""
-    rx = rx_mat(euler_deg[0])
-    ry = ry_mat(euler_deg[1])
-    rz = rz_mat(euler_deg[2])
-    return numpy.matmul(rz, numpy.matmul(ry,rx))
-
-def mat_to_euler(mat: numpy_typing.NDArray[numpy.float64]) -> Tuple[float, float, float]:
-    """translate rotation matrix to euler angle"""
-    r31 = mat[2,0]
-    if numpy.abs(r31) != 1:
-        ry = -numpy.arcsin(r31)
-        rx = numpy.arctan2(mat[2,1]/numpy.cos(ry), mat[2,2]/numpy.cos(ry))
-        rz = numpy.arctan2(mat[1,0]/numpy.cos(ry), mat[0,0]/numpy.cos(ry))
+    r11, r12, r13, r21, r22, r23, r31, r32, r33 = _rotation_entries(euler_deg)
+    return _array([
+        [r11, r12, r13],
+        [r21, r22, r23],
+        [r31, r32, r33],
+    ], dtype=DTYPE)
+
+def _entries_to_euler(
+        r11: float, r12: float, r13: float, r21: float, r31: float, r32: float, r33: float
+    ) -> Tuple[float, float, float]:
+    """translate the needed entries of a rotation matrix to euler angle"""
+    if abs(r31) < _GIMBAL_LIMIT:
+        # cos(ry) is positive here, and atan2 is scale invariant,
+        # so the entries need not be divided by it
+        ry = -_asin(r31)
+        rx = _atan2(r32, r33)
+        rz = _atan2(r21, r11)
     else:
         rz = 0
-        if r31 == -1:
-            ry = numpy.pi / 2
-            rx = numpy.arctan2(mat[0,1],mat[0,2])
+        if r31 < 0:
+            ry = _HALF_PI
+            rx = _atan2(r12,r13)
         else:
-            ry = -numpy.pi / 2
-            rx = numpy.arctan2(-mat[0,1],-mat[0,2])
-    return (rad_to_deg(rx), rad_to_deg(ry), rad_to_deg(rz))
+            ry = -_HALF_PI
+            rx = _atan2(-r12,-r13)
+    return (rx * _R2D, ry * _R2D, rz * _R2D)
+
+def mat_to_euler(mat: numpy_typing.NDArray[numpy.float64]) -> Tuple[float, float, float]:
+    """translate rotation matrix to euler angle"""
+    return _entries_to_euler(
+        float(mat[0,0]), float(mat[0,1]), float(mat[0,2]),
+        float(mat[1,0]), float(mat[2,0]), float(mat[2,1]), float(mat[2,2]),
+    )
+
+def _euler_to_quat(euler_deg: Tuple[float, float, float]) -> Tuple[float, float, float, float]:
+    """translate euler angle to unit quaternion `(w, x, y, z)`"""
+    hx, hy, hz = euler_deg[0] * _D2R / 2, euler_deg[1] * _D2R / 2, euler_deg[2] * _D2R / 2
+    cx, sx = _cos(hx), _sin(hx)
+    cy, sy = _cos(hy), _sin(hy)
+    cz, sz = _cos(hz), _sin(hz)
+    return (
+        cx*cy*cz + sx*sy*sz,
+        sx*cy*cz - cx*sy*sz,
+        cx*sy*cz + sx*cy*sz,
+        cx*cy*sz - sx*sy*cz,
+    )
+
+def _quat_entries(quat: Tuple[float, float, float, float]) -> Tuple[float, ...]:
+    """entries of the rotation matrix of a unit quaternion in row major order"""
+    w, x, y, z = quat
+    return (
+        1 - 2*(y*y + z*z),     2*(x*y - w*z),     2*(x*z + w*y),
+            2*(x*y + w*z), 1 - 2*(x*x + z*z),     2*(y*z - w*x),
+            2*(x*z - w*y),     2*(y*z + w*x), 1 - 2*(x*x + y*y),
+    )
+
+def _quat_to_euler(quat: Tuple[float, float, float, float]) -> Tuple[float, float, float]:
+    """translate unit quaternion to euler angle"""
+    r11, r12, r13, r21, _, _, r31, r32, r33 = _quat_entries(quat)
+    return _entries_to_euler(r11, r12, r13, r21, r31, r32, r33)
+
+def _quat_mul(
+        a: Tuple[float, float, float, float],
+        b: Tuple[float, float, float, float]
+    ) -> Tuple[float, float, float, float]:
+    """hamilton product of two unit quaternion, renormalized"""
+    aw, ax, ay, az = a
+    bw, bx, by, bz = b
+    w = aw*bw - ax*bx - ay*by - az*bz
+    x = aw*bx + ax*bw + ay*bz - az*by
+    y = aw*by - ax*bz + ay*bw + az*bx
+    z = aw*bz + ax*by - ay*bx + az*bw
+    n = _sqrt(w*w + x*x + y*y + z*z)
+    return (w/n, x/n, y/n, z/n)
+
+def _quat_rotate(
+        quat: Tuple[float, float, float, float],
+        vec: Tuple[float, float, float]
+    ) -> Tuple[float, float, float]:
+    """rotate a vector by a unit quaternion"""
+    w, x, y, z = quat
+    vx, vy, vz = vec
+    # t = 2 * (q.xyz cross v)
+    tx = 2 * (y*vz - z*vy)
+    ty = 2 * (z*vx - x*vz)
+    tz = 2 * (x*vy - y*vx)
+    # v + w * t + q.xyz cross t
+    return (
+        vx + w*tx + y*tz - z*ty,
+        vy + w*ty + z*tx - x*tz,
+        vz + w*tz + x*ty - y*tx,
+    )
 
 class Transform(IntoRobotCommand):
     """
@@ -90,6 +205,10 @@ class Transform(IntoRobotCommand):
     ## Representation
     - `vec_mm` : a 3D vector with unit in mm
     - `euler_deg` : a set of euler angle wiht unit in degree
+
+    internally the rotation is kept as a unit quaternion, see `quat`,
+    so composing transform does not round trip through euler angle,
+    euler angle of a composed transform is only computed when accessed
     """
     def __init__(
             self,
@@ -103,12 +222,80 @@ class Transform(IntoRobotCommand):
         - `vec_mm` : a 3D vector with unit in mm
         - `euler_deg` : a set of euler angle wiht unit in degree
         """
-        self.vec_mm : Tuple[float, float, float]= vec_mm
-        self.euler_deg : Tuple[float, float, float]= euler_deg
+        self._x : float = vec_mm[0]
+        self._y : float = vec_mm[1]
+        self._z : float = vec_mm[2]
+        self._rx : float = euler_deg[0]
+        self._ry : float = euler_deg[1]
+        self._rz : float = euler_deg[2]
+        self._has_euler : bool = True
+        """whether `_rx`, `_ry`, `_rz` are valid, `False` until computed from `_quat`"""
+        self._quat : Tuple[float, float, float, float] | None = None
+        """quaternion of the rotation, `None` until computed from euler angle"""
+        self._homogenous : _Mat | None = None
+        """cached result of `to_homogenous`"""
+
+    @classmethod
+    def _from_quat(
+            cls,
+            vec_mm : Tuple[float, float, float],
+            quat : Tuple[float, float, float, float]
+        ) -> 'Transform':
+        """construct a new `Transform` from a vector and a unit quaternion"""
+        t = cls.__new__(cls)
+        t._x, t._y, t._z = vec_mm
+        t._rx = t._ry = t._rz = 0.0
+        t._has_euler = False
+        t._quat = quat
+        t._homogenous = None
+        return t
+
+    def _assign(self, other: 'Transform'):
+        """copy the state of `other` into `self`"""
+        vars(self).update(vars(other))
+
+    def _ensure_euler(self):
+        """compute the euler angle from the quaternion if they are not valid"""
+        if not self._has_euler:
+            self._rx, self._ry, self._rz = \
+                _quat_to_euler(cast(Tuple[float, float, float, float], self._quat))
+            self._has_euler = True
+
+    @property
+    def vec_mm(self) -> Tuple[float, float, float]:
+        """a 3D vector with unit in mm"""
+        return (self._x, self._y, self._z)
+
+    @vec_mm.setter
+    def vec_mm(self, vec_mm: Tuple[float, float, float]):
+        self._x, self._y, self._z = vec_mm
+        self._homogenous = None
+
+    @property
+    def euler_deg(self) -> Tuple[float, float, float]:
+        """a set of euler angle wiht unit in degree"""
+        self._ensure_euler()
+        return (self._rx, self._ry, self._rz)
+
+    @euler_deg.setter
+    def euler_deg(self, euler_deg: Tuple[float, float, float]):
+        self._rx, self._ry, self._rz = euler_deg
+        self._has_euler = True
+        self._quat = None
+        self._homogenous = None
+
+    @property
+    def quat(self) -> Tuple[float, float, float, float]:
+        """the rotation as a unit quaternion `(w, x, y, z)`"""
+        if self._quat is None:
+            self._quat = _euler_to_quat((self._rx, self._ry, self._rz))
+        return self._quat
 
     def clone(self) -> 'Transform':
         """clone the transform"""
-        return Transform(vec_mm=self.vec_mm, euler_deg=self.euler_deg)
+        t = Transform.__new__(Transform)
+        vars(t).update(vars(self))
+        return t
 
     def __repr__(self) -> str:
         return f"vec_mm : {self.vec_mm}, euler_deg : {self.euler_deg}"
@@ -135,29 +322,18 @@ class Transform(IntoRobotCommand):
 
     @classmethod
     def from_robot(cls, res: str) -> 'Transform':
-        """Parse robot transform response into `Transform`"""
-        res = re.sub(r"[ {}]","",res).split(",")
-        t = Transform()
-        for i in range(6):
-            tokens = res[i].split(":")
-            q = float(tokens[1])
-
-            match tokens[0]:
-                case "x":
-                    t.set_x(q * 1000)
-                case "y":
-                    t.set_y(q * 1000)
-                case "z":
-                    t.set_z(q * 1000)
-                case "rx":
-                    t.set_rx(rad_to_deg(q))
-                case "ry":
-                    t.set_ry(rad_to_deg(q))
-                case "rz":
-                    t.set_rz(rad_to_deg(q))
-                case _:
-                    continue
-        return t
+        """
+        Parse robot transform response into `Transform`
+
+        example input:
+
+        `{rx : -1.793361, ry : 0.255386, rz : 1.682603, 
+        x : -0.073378, y : -0.014815, z : 0.929764, }`
+        """
+        q = dict.fromkeys(_ROBOT_SCALE, 0.0)
+        for m in _ROBOT_RE.finditer(res):
+            q[m.group(1)] = float(m.group(2)) * _ROBOT_SCALE[m.group(1)]
+        return Transform((q["x"], q["y"], q["z"]), (q["rx"], q["ry"], q["rz"]))
 
     def vec_only(self) -> 'Transform':
         """Extract translation from `self` and construct a new transfrom"""
@@ -169,28 +345,28 @@ class Transform(IntoRobotCommand):
     @classmethod
     def from_x(cls, x_mm: float) -> 'Transform':
         """Construct a new `Transform` with specified x"""
-        return Transform.from_vec(x_mm=x_mm)
+        return Transform((x_mm, 0, 0))
     @classmethod
     def from_y(cls, y_mm: float) -> 'Transform':
         """Construct a new `Transform` with specified y"""
-        return Transform.from_vec(y_mm=y_mm)
+        return Transform((0, y_mm, 0))
     @classmethod
     def from_z(cls, z_mm: float) -> 'Transform':
         """Construct a new `Transform` with specified z"""
-        return Transform.from_vec(z_mm=z_mm)
+        return Transform((0, 0, z_mm))
 
     @classmethod
     def from_rx(cls, rx_deg: float) -> 'Transform':
         """Construct a new `Transform` with specified rx"""
-        return Transform.from_euler(rx_deg=rx_deg)
+        return Transform(euler_deg=(rx_deg, 0, 0))
     @classmethod
     def from_ry(cls, ry_deg: float) -> 'Transform':
         """Construct a new `Transform` with specified ry"""
-        return Transform.from_euler(ry_deg=ry_deg)
+        return Transform(euler_deg=(0, ry_deg, 0))
     @classmethod
     def from_rz(cls, rz_deg: float) -> 'Transform':
         """Construct a new `Transform` with specified rz"""
-        return Transform.from_euler(rz_deg=rz_deg)
+        return Transform(euler_deg=(0, 0, rz_deg))
 
     def set_vec(self, x_mm: float, y_mm: float, z_mm: float) -> 'Transform':
         """set the vector"""
@@ -199,15 +375,18 @@ class Transform(IntoRobotCommand):
 
     def set_x(self, mm: float) -> 'Transform':
         """set the x component to a specified value"""
-        self.vec_mm = (mm,self.vec_mm[1],self.vec_mm[2])
+        self._x = mm
+        self._homogenous = None
         return self
     def set_y(self, mm: float) -> 'Transform':
         """set the y component to a specified value"""
-        self.vec_mm = (self.vec_mm[0],mm,self.vec_mm[2])
+        self._y = mm
+        self._homogenous = None
         return self
     def set_z(self, mm: float) -> 'Transform':
         """set the z component to a specified value"""
-        self.vec_mm = (self.vec_mm[0],self.vec_mm[1],mm)
+        self._z = mm
+        self._homogenous = None
         return self
 
     def set_euler(self, rx_deg: float, ry_deg: float, rz_deg: float) -> 'Transform':
@@ -217,28 +396,55 @@ class Transform(IntoRobotCommand):
 
     def set_rx(self, deg: float) -> 'Transform':
         """set the rx component to a specified value"""
-        self.euler_deg = (deg,self.euler_deg[1],self.euler_deg[2])
+        self._ensure_euler()
+        self._rx = deg
+        self._quat = None
+        self._homogenous = None
         return self
     def set_ry(self, deg: float) -> 'Transform':
         """set the ry component to a specified value"""
-        self.euler_deg = (self.euler_deg[0],deg,self.euler_deg[2])
+        self._ensure_euler()
+        self._ry = deg
+        self._quat = None
+        self._homogenous = None
         return self
     def set_rz(self, deg: float) -> 'Transform':
         """set the rz component to a specified value"""
-        self.euler_deg = (self.euler_deg[0],self.euler_deg[1],deg)
+        self._ensure_euler()
+        self._rz = deg
+        self._quat = None
+        self._homogenous = None
         return self
 
 
-    def to_homogenous(self) -> numpy_typing.NDArray[numpy.float64]:
+    def to_homogenous(self) -> _Mat:
         """
         return a homogenous matrix representation of the `self`
         
+        the result is cached until `self` is modified,
+        thus the returned matrix is read-only
+
         ## Return:
         - `np.array` : 4x4 homogenous matrix representation of the transform
         """
-        mat = numpy.eye(4)
-        mat[0:3,0:3] = euler_to_mat(self.euler_deg)
-        mat[0:3,3] = numpy.asarray(self.vec_mm)
+        if self._homogenous is not None:
+            return self._homogenous
+
+        if self._has_euler:
+            entries = _rotation_entries((self._rx, self._ry, self._rz))
+        else:
+            entries = _quat_entries(cast(Tuple[float, float, float, float], self._quat))
+        r11, r12, r13, r21, r22, r23, r31, r32, r33 = entries
+        x, y, z = self._x, self._y, self._z
+        mat = _array([
+            [r11, r12, r13,   x],
+            [r21, r22, r23,   y],
+            [r31, r32, r33,   z],
+            [0.0, 0.0, 0.0, 1.0],
+        ], dtype=DTYPE)
+        mat.flags.writeable = False
+
+        self._homogenous = mat
         return mat
 
     @classmethod
@@ -262,11 +468,40 @@ class Transform(IntoRobotCommand):
         )
 
     def inv(self) -> 'Transform':
-        """return the inverse transform of `self`"""
-        return Transform.from_homogenous(numpy.linalg.inv(self.to_homogenous()))
+        """
+        return the inverse transform of `self`
+
+        computed as the conjugate rotation and the translation rotated back by it
+        """
+        w, x, y, z = self.quat
+        conj = (w, -x, -y, -z)
+        vx, vy, vz = _quat_rotate(conj, (self._x, self._y, self._z))
+        return Transform._from_quat((-vx, -vy, -vz), conj)
+
+    def _is_vec_only(self) -> bool:
+        """whether the rotation of `self` is known to be identity"""
+        return self._has_euler and self._rx == 0 and self._ry == 0 and self._rz == 0
 
     def __mul__(self, rhs: 'Transform') -> 'Transform':
-        return Transform.from_homogenous(numpy.matmul(self.to_homogenous(), rhs.to_homogenous()))
+        if self._is_vec_only():
+            # pure translation, only shift `rhs`, its rotation is kept as is
+            t = rhs.clone()
+            x, y, z = t.vec_mm
+            t.vec_mm = (x + self._x, y + self._y, z + self._z)
+            return t
+        if rhs._is_vec_only():
+            # rotation of `self` is kept as is, only `rhs`'s translation is rotated
+            t = self.clone()
+            rx, ry, rz = _quat_rotate(self.quat, rhs.vec_mm)
+            t.vec_mm = (self._x + rx, self._y + ry, self._z + rz)
+            return t
+
+        quat = self.quat
+        rx, ry, rz = _quat_rotate(quat, rhs.vec_mm)
+        return Transform._from_quat(
+            (self._x + rx, self._y + ry, self._z + rz),
+            _quat_mul(quat, rhs.quat)
+        )
 
     def then(self, transform: 'Transform') -> 'Transform':
         """
@@ -279,8 +514,7 @@ class Transform(IntoRobotCommand):
         - `transform` : resulted transform
         """
         new = transform * self
-        self.vec_mm = new.vec_mm
-        self.euler_deg = new.euler_deg
+        self._assign(new)
         return self
 
     def then_x(self, cm: float) -> 'Transform':
@@ -316,7 +550,14 @@ class Transform(IntoRobotCommand):
 
     def then_relative(self, transform: 'Transform') -> 'Transform':
         """return a new transform that apply a transform relative `self`'s position"""
-        return self.then_relative_to(transform=transform, reference=self.vec_only())
+        # reference is `self.vec_only()`, a pure translation `p`, so
+        # `p * transform * p.inv() * self` reduce to rotating `self` in place
+        # by `transform` and then translating by the `transform`'s vector
+        x, y, z = transform.vec_mm
+        return Transform._from_quat(
+            (self._x + x, self._y + y, self._z + z),
+            _quat_mul(transform.quat, self.quat)
+        )
 
     def then_relative_rx(self, deg:float) -> 'Transform':
         """return a new transform that apply relative rotaion along axis x"""
@@ -348,11 +589,160 @@ class Transform(IntoRobotCommand):
         ## Parameter
         - `data: dict[str, str|float]`: the data, if field is missing, 0 will be assumed
         """
-        x = 0 if "x" not in data else data['x']
-        y = 0 if "y" not in data else data['y']
-        z = 0 if "z" not in data else data['z']
-        rx = 0 if "rx" not in data else data['rx']
-        ry = 0 if "ry" not in data else data['ry']
-        rz = 0 if "rz" not in data else data['rz']
-
-        return Transform((x,y,z),(rx,ry,rz))
+        get = data.get
+        return Transform(
+            (get("x", 0), get("y", 0), get("z", 0)),
+            (get("rx", 0), get("ry", 0), get("rz", 0)),
+        )
+
+
+def _euler_to_quat_batch(
+        euler_deg: numpy_typing.NDArray[numpy.float64]
+    ) -> numpy_typing.NDArray[numpy.float64]:
+    """translate `(N,3)` euler angle to `(N,4)` unit quaternion `(w, x, y, z)`"""
+    half = euler_deg * (_D2R / 2)
+    c, s = numpy.cos(half), numpy.sin(half)
+    cx, cy, cz = c[:,0], c[:,1], c[:,2]
+    sx, sy, sz = s[:,0], s[:,1], s[:,2]
+    return numpy.stack([
+        cx*cy*cz + sx*sy*sz,
+        sx*cy*cz - cx*sy*sz,
+        cx*sy*cz + sx*cy*sz,
+        cx*cy*sz - sx*sy*cz,
+    ], axis=-1)
+
+def _quat_rotate_batch(
+        quat: numpy_typing.NDArray[numpy.float64],
+        vec: numpy_typing.NDArray[numpy.float64]
+    ) -> numpy_typing.NDArray[numpy.float64]:
+    """rotate `(N,3)` vectors by `(N,4)` unit quaternions"""
+    w, u = quat[:,0:1], quat[:,1:4]
+    t = 2 * numpy.cross(u, vec)
+    return vec + w * t + numpy.cross(u, t)
+
+def _quat_mul_batch(
+        a: numpy_typing.NDArray[numpy.float64],
+        b: numpy_typing.NDArray[numpy.float64]
+    ) -> numpy_typing.NDArray[numpy.float64]:
+    """hamilton product of `(N,4)` unit quaternions, renormalized"""
+    aw, ax, ay, az = a[:,0], a[:,1], a[:,2], a[:,3]
+    bw, bx, by, bz = b[:,0], b[:,1], b[:,2], b[:,3]
+    out = numpy.stack([
+        aw*bw - ax*bx - ay*by - az*bz,
+        aw*bx + ax*bw + ay*bz - az*by,
+        aw*by - ax*bz + ay*bw + az*bx,
+        aw*bz + ax*by - ay*bx + az*bw,
+    ], axis=-1)
+    return out / numpy.linalg.norm(out, axis=-1, keepdims=True)
+
+class BatchTransform:
+    """
+    # BatchTransform
+    A class representing `N` spatial transform at once,
+    stored as arrays so calculation is vectorized over all of them
+
+    ## Representation
+    - `vecs_mm` : `(N,3)` array of 3D vector with unit in mm
+    - `quats` : `(N,4)` array of unit quaternion `(w, x, y, z)`
+
+    ## Usage
+    ```python
+    waypoints = BatchTransform.from_list([Transform.from_x(i) for i in range(1000)])
+    moved = BatchTransform.from_list([Transform.from_rz(90)]) * waypoints
+    targets = moved.to_list()
+    ```
+    """
+    def __init__(
+            self,
+            vecs_mm : numpy_typing.NDArray[numpy.float64],
+            quats : numpy_typing.NDArray[numpy.float64]
+        ):
+        """
+        initalize a batch of transform
+
+        ## Parameter
+        - `vecs_mm` : `(N,3)` array of 3D vector with unit in mm
+        - `quats` : `(N,4)` array of unit quaternion `(w, x, y, z)`
+        """
+        self.vecs_mm : numpy_typing.NDArray[numpy.float64] = \
+            numpy.asarray(vecs_mm, dtype=numpy.float64).reshape(-1, 3)
+        self.quats : numpy_typing.NDArray[numpy.float64] = \
+            numpy.asarray(quats, dtype=numpy.float64).reshape(-1, 4)
+
+    def __len__(self) -> int:
+        return len(self.vecs_mm)
+
+    @classmethod
+    def from_eulers_vecs(
+            cls,
+            eulers_deg : numpy_typing.NDArray[numpy.float64],
+            vecs_mm : numpy_typing.NDArray[numpy.float64]
+        ) -> 'BatchTransform':
+        """
+        construct a new `BatchTransform` from arrays of euler angle and vector
+
+        ## Parameter
+        - `eulers_deg` : `(N,3)` array of euler angle with unit in degree
+        - `vecs_mm` : `(N,3)` array of 3D vector with unit in mm
+        """
+        eulers_deg = numpy.asarray(eulers_deg, dtype=numpy.float64).reshape(-1, 3)
+        return BatchTransform(vecs_mm, _euler_to_quat_batch(eulers_deg))
+
+    @classmethod
+    def from_list(cls, transforms: list[Transform]) -> 'BatchTransform':
+        """construct a new `BatchTransform` from a list of `Transform`"""
+        return BatchTransform(
+            numpy.array([t.vec_mm for t in transforms], dtype=numpy.float64),
+            numpy.array([t.quat for t in transforms], dtype=numpy.float64),
+        )
+
+    def to_list(self) -> list[Transform]:
+        """return a list of `Transform` of the batch"""
+        return [
+            Transform._from_quat(
+                cast(Tuple[float, float, float], tuple(vec)),
+                cast(Tuple[float, float, float, float], tuple(quat)),
+            )
+            for vec, quat in zip(self.vecs_mm.tolist(), self.quats.tolist())
+        ]
+
+    def to_homogenous(self) -> _Mat:
+        """
+        return homogenous matrix representation of the batch
+
+        ## Return:
+        - `np.array` : `(N,4,4)` homogenous matrices
+        """
+        w, x, y, z = self.quats[:,0], self.quats[:,1], self.quats[:,2], self.quats[:,3]
+        mat = numpy.zeros((len(self), 4, 4), dtype=DTYPE)
+        mat[:,0,0] = 1 - 2*(y*y + z*z)
+        mat[:,0,1] = 2*(x*y - w*z)
+        mat[:,0,2] = 2*(x*z + w*y)
+        mat[:,1,0] = 2*(x*y + w*z)
+        mat[:,1,1] = 1 - 2*(x*x + z*z)
+        mat[:,1,2] = 2*(y*z - w*x)
+        mat[:,2,0] = 2*(x*z - w*y)
+        mat[:,2,1] = 2*(y*z + w*x)
+        mat[:,2,2] = 1 - 2*(x*x + y*y)
+        mat[:,0:3,3] = self.vecs_mm
+        mat[:,3,3] = 1
+        return mat
+
+    def inv(self) -> 'BatchTransform':
+        """return the inverse of every transform in the batch"""
+        conj = self.quats * numpy.array([1.0, -1.0, -1.0, -1.0])
+        return BatchTransform(-_quat_rotate_batch(conj, self.vecs_mm), conj)
+
+    def __mul__(self, rhs: 'BatchTransform') -> 'BatchTransform':
+        """
+        compose every transform pairwise,
+        a batch of 1 is broadcasted against the other batch
+        """
+        lhs_quats = numpy.broadcast_to(self.quats, (max(len(self), len(rhs)), 4))
+        lhs_vecs = numpy.broadcast_to(self.vecs_mm, lhs_quats.shape[:1] + (3,))
+        rhs_quats = numpy.broadcast_to(rhs.quats, lhs_quats.shape)
+        rhs_vecs = numpy.broadcast_to(rhs.vecs_mm, lhs_vecs.shape)
+        return BatchTransform(
+            lhs_vecs + _quat_rotate_batch(lhs_quats, rhs_vecs),
+            _quat_mul_batch(lhs_quats, rhs_quats),
+        )
@@ -24,10 +24,17 @@ message generation of IVA communication protocal to inovo robots
 """
 from typing import Literal
 from enum import Enum
-import numpy
+import math
 from inovopy.utils import clamp
 import inovopy
 
+_2PI : float = 2 * math.pi
+_D2R : float = math.pi / 180.0
+
+def _scale_or_zero(value: float | None, scale: float, floor: float, ceil: float) -> float:
+    """scale a motion parameter to robot unit and clamp it, `0` if it is not given"""
+    return clamp(value * scale, floor, ceil) if value else 0.0
+
 def execute(robot_command: 'RobotCommand', enter_context: bool = False) -> dict[str,str|float]:
     """
     generate jsonable `dict[str,str|float]` for execute command
@@ -36,11 +43,9 @@ def execute(robot_command: 'RobotCommand', enter_context: bool = False) -> dict[
     - `robot_command : RobotCommand` : the robot command to execute
     - `enter_context : bool` : whether or not to push to the context stack
     """
-    return {
-        'op_code' : 'execute',
-        'enter_context' : 1 if enter_context else 0,
-        **robot_command.to_dict()
-    }
+    d : dict[str,str|float] = {'op_code' : 'execute', 'enter_context' : int(enter_context)}
+    d.update(robot_command.argument)
+    return d
 
 def enqueue(robot_command: 'RobotCommand') -> dict[str,str|float]:
     """
@@ -49,10 +54,9 @@ def enqueue(robot_command: 'RobotCommand') -> dict[str,str|float]:
     ## Parameter
     - `robot_command : RobotCommand` : the robot command to enqueue
     """
-    return {
-        'op_code' : 'enqueue',
-        **robot_command.to_dict()
-    }
+    d : dict[str,str|float] = {'op_code' : 'enqueue'}
+    d.update(robot_command.argument)
+    return d
 
 def dequeue(enter_context : bool = False) -> dict[str, str|float]:
     """
@@ -63,7 +67,7 @@ def dequeue(enter_context : bool = False) -> dict[str, str|float]:
     """
     return {
         'op_code' : 'dequeue',
-        'enter_context' : 1 if enter_context else 0
+        'enter_context' : int(enter_context)
     }
 
 def pop() -> dict[str, str|float]:
@@ -81,10 +85,9 @@ def gripper(gripper_command : 'GripperCommand') -> dict[str,str|float]:
     ## Parameter
     - `gripper_command : GripperCommand` : gripper command to execute
     """
-    return {
-        'op_code' : 'gripper',
-        **gripper_command.to_dict()
-    }
+    d : dict[str,str|float] = {'op_code' : 'gripper'}
+    d.update(gripper_command.argument)
+    return d
 
 def io(io_command : 'IOCommand') -> dict[str,str|float]:
     """
@@ -93,10 +96,9 @@ def io(io_command : 'IOCommand') -> dict[str,str|float]:
     ## Parameter
     - `io_command : IOCommand` : io command to execute
     """
-    return {
-        'op_code' : 'io',
-        **io_command.to_dict()
-    }
+    d : dict[str,str|float] = {'op_code' : 'io'}
+    d.update(io_command.argument)
+    return d
 
 def get_current(target: Literal["transform", "joint_coord"]) -> dict[str, str|float]:
     """
@@ -130,10 +132,9 @@ def custom(custom_command : dict[str,str|float]) -> dict[str,str|float]:
     ## Parameter
     - `custom_command : dict[str,str|float]` : custom command to execute
     """
-    return {
-        'op_code' : 'custom',
-        **custom_command
-    }
+    d : dict[str,str|float] = {'op_code' : 'custom'}
+    d.update(custom_command)
+    return d
 
 class RobotCommand:
     """
@@ -146,6 +147,8 @@ class RobotCommand:
     - `set_parameter` : command to set motion parameter of robot
     - `motion` : command to move the robot
     """
+    __slots__ = ("argument",)
+
     def __init__(self,argument: dict[str,str|float]):
         self.argument : dict[str,str|float] = argument
 
@@ -195,22 +198,12 @@ class RobotCommand:
         - `tcp_speed_angular : float`, in degree, range from `1` to `360`
         """
 
-        speed = clamp(speed / 100, 0.01, 1) if speed else 0
-
-        accel = clamp(accel / 100, 0.01, 1) if accel else 0
-
-        blend_linear = clamp(blend_linear / 1000, 0.001, 1) if blend_linear else 0
-
-        blend_angular = clamp(\
-            inovopy.geometry.transform.deg_to_rad(blend_angular), 0.001, 2 * numpy.pi) \
-            if blend_angular else 0
-
-        tcp_speed_linear = clamp(tcp_speed_linear/1000, 0.001, 0.999) \
-            if tcp_speed_linear else 0
-
-        tcp_speed_angular = clamp(\
-            inovopy.geometry.transform.deg_to_rad(tcp_speed_angular), 0.001, 2 * numpy.pi) \
-            if tcp_speed_angular else 0
+        speed = _scale_or_zero(speed, 0.01, 0.01, 1.0)
+        accel = _scale_or_zero(accel, 0.01, 0.01, 1.0)
+        blend_linear = _scale_or_zero(blend_linear, 0.001, 0.001, 1.0)
+        blend_angular = _scale_or_zero(blend_angular, _D2R, 0.001, _2PI)
+        tcp_speed_linear = _scale_or_zero(tcp_speed_linear, 0.001, 0.001, 0.999)
+        tcp_speed_angular = _scale_or_zero(tcp_speed_angular, _D2R, 0.001, _2PI)
 
         return RobotCommand({
             "action" : "set_parameter",
@@ -237,7 +230,7 @@ class RobotCommand:
         """
         return RobotCommand({
             "action" : "motion",
-            "motion_mode" : f"{motion_mode}",
+            "motion_mode" : motion_mode.to_arg(),
             **target.to_dict()
         })
 
@@ -256,7 +249,11 @@ class MotionMode(str, Enum):
     LINEAR = "linear"
     LINEAR_RELATIVE = "linear_relative"
     JOINT = "joint"
-    JOINT_RELATIVE = "joint_relatve"
+    JOINT_RELATIVE = "joint_relative"
+
+    def to_arg(self) -> str:
+        """return the IVA argument string of the motion mode"""
+        return self.value
 
 
 class IOCommand:
@@ -270,8 +267,10 @@ class IOCommand:
     - `set_wrist`
     - `get_wrist`
     """
+    __slots__ = ("argument",)
+
     def __init__(self, argument : dict[str,str|float]):
-        self.argument = argument
+        self.argument : dict[str,str|float] = argument
 
     def to_dict(self) -> dict[str,str|float]:
         """return a `dict[str,str|float]` representation of the io command"""
@@ -325,8 +324,10 @@ class GripperCommand:
     - `set`
     - `get`
     """
+    __slots__ = ("argument",)
+
     def __init__(self, argument : dict[str,str|float]):
-        self.argument = argument
+        self.argument : dict[str,str|float] = argument
 
     def to_dict(self) -> dict[str,str|float]:
         """return `dict[str,str|float]` representation of the command"""
@@ -10,6 +10,7 @@ with different level of verbosity
 - `Logger` : A class for managing multiple log target
 - `ConsoleTarget` : A class for logging message to console
 - `RollingFileTarget` : A class for logging message to rolling files
+- `QueueTarget` : A class for logging message to another target on a background thread
 
 ## Example
 ```python
@@ -23,7 +24,12 @@ example_logger.error("This is a error level message.")
 ```
 """
 import os
-from typing import Optional, IO, cast
+import sys
+import atexit
+import queue
+import threading
+import weakref
+from typing import Callable, Optional, IO, cast
 from abc import ABC, abstractmethod
 from enum import IntEnum
 
@@ -54,18 +60,12 @@ class LogLevel(IntEnum):
         ## Return
         `str`: a string representation of the log level
         """
-        if self == LogLevel.TRACE:
-            return "TRACE"
-        elif self == LogLevel.DEBUG:
-            return "DEBUG"
-        elif self == LogLevel.INFO:
-            return "INFO"
-        elif self == LogLevel.WARN:
-            return "WARN"
-        elif self == LogLevel.ERROR:
-            return "ERROR"
-        else:
-            return ""
+        return _LEVEL_STR[self]
+
+_LEVEL_STR : tuple[str, ...] = ("TRACE", "DEBUG", "INFO", "WARN", "ERROR", "")
+"""string representation of each log level, indexed by level"""
+_LEVEL_TAG : tuple[str, ...] = tuple(f"{s: <6} | " for s in _LEVEL_STR)
+"""tag prepend to message of each log level by `Logger.log`, indexed by level"""
 
 class LogTarget(ABC):
     """
@@ -94,6 +94,8 @@ class LogTarget(ABC):
     example_logger.add_target(MyTarget())
     ```
     """
+    __slots__ = ()
+
     @abstractmethod
     def log_to_target(self, msg:str, log_level: LogLevel):
         """
@@ -111,6 +113,11 @@ class LogTarget(ABC):
         ## Return:
         `LogLevel`: the log level of the target
         """
+    def flush(self):
+        """
+        write out any message buffered by the target,
+        by default there is nothing to write
+        """
 
 
 class Logger:
@@ -131,14 +138,36 @@ class Logger:
     example_logger.warn("This is a warn level message.")
     example_logger.error("This is a error level message.")
     ```
+
+    ## Background Logging
+    with `background=True`, each target added is wrapped in a `QueueTarget`,
+    so `log` only put the message on a queue,
+    and a background thread log it to the target,
+    so a slow target never block the caller.
+    pending message are logged before interpreter exit.
+    ```python
+    example_logger = Logger.default("Example", background=True)
+    ```
     """
-    def __init__(self):
+    __slots__ = ("__targets", "__sinks", "__dispatchers", "__min_level", "__background")
+
+    def __init__(self, background: bool = False):
         """
         initalize the logger with no logging target
+
+        ## Parameter
+        - `background : bool` : log to the targets on a background thread, see `QueueTarget`
         """
         self.__targets : list[LogTarget] = []
+        self.__sinks : list[LogTarget] = []
+        """target message are dispatched to, the `QueueTarget` wrapping each target if background"""
+        self.__dispatchers : list[tuple[LogLevel, Callable[[str, LogLevel], None]]] = []
+        """log level and bound `log_to_target` of each sink, rebuilt by `add_target`"""
+        self.__min_level : LogLevel = LogLevel.NOLOG
+        """lowest log level among the targets, message below it are discarded early"""
+        self.__background : bool = background
 
-    def log(self, msg: str, log_level: LogLevel):
+    def log(self, msg: str, log_level: LogLevel, *args):
         """
         log a message with a specified log level to all of logger's target
 
@@ -149,26 +178,62 @@ class Logger:
         the message will only log to the target if the target's log level
         if smaller than the message logging level
 
+        if `args` are given, the message is formatted as `msg % args`,
+        only when some target will log it,
+        e.g. `logger.debug("res : %s", res)` cost nothing when debug is not logged
+
         ## Parameter:
         - `msg : str` : message to log
         - `log_level` : log level of the message
+        - `args` : argument to format the message with
         """
-        msg = f"{log_level.to_str(): <6} | {msg}"
+        if log_level < self.__min_level:
+            return
+        if args:
+            msg = msg % args
+        msg = _LEVEL_TAG[log_level] + msg
+        for target_level, log_to_target in self.__dispatchers:
+            if target_level <= log_level:
+                log_to_target(msg, log_level)
+
+    def stop(self):
+        """
+        stop the background threads, after all pending message are logged,
+        message logged afterward are logged on the caller thread
+        """
+        for sink in self.__sinks:
+            if isinstance(sink, QueueTarget):
+                sink.stop()
+        self.__background = False
+        self.__sinks = list(self.__targets)
+        self.__rebuild()
         for target in self.__targets:
-            if target.get_log_level() <= log_level:
-                target.log_to_target(msg, log_level)
+            target.flush()
 
     def add_target(self, target: LogTarget):
         """
         add a logging target to the logger
 
+        the log level of the target is read when it is added,
+        add the target again after changing its log level
+
         ## Parameter
         - `target: LogTarget` : an object that implement `LogTarget`
         """
-        self.__targets.append(target)
+        if target not in self.__targets:
+            self.__targets.append(target)
+            self.__sinks.append(QueueTarget(target) if self.__background else target)
+        self.__rebuild()
+
+    def __rebuild(self):
+        """rebuild the dispatchers and the min log level from the sinks"""
+        self.__dispatchers = [(t.get_log_level(), t.log_to_target) for t in self.__sinks]
+        self.__min_level = min(
+            (level for level, _ in self.__dispatchers), default=LogLevel.NOLOG
+        )
 
     @classmethod
-    def default(cls, name:str) -> 'Logger':
+    def default(cls, name:str, background: bool = False) -> 'Logger':
         """
         construct an default logger for command usage
 
@@ -176,11 +241,12 @@ class Logger:
 
         ## Parameters:
         - `name : str` : the name to initalize the target with
+        - `background : bool` : log to the targets on a background thread
 
         ## Return:
         `Logger` : the constructed logger
         """
-        logger = Logger()
+        logger = Logger(background=background)
         logger.add_default_target(name)
         return logger
 
@@ -196,50 +262,55 @@ class Logger:
         self.add_target(ConsoleTarget(name=name))
         self.add_target(RollingFileTarget(name=name))
 
-    def trace(self, msg: str):
+    def trace(self, msg: str, *args):
         """
         log a message with `TRACE` level
 
         ## Parameter:
         - `msg : str` : message to log
+        - `args` : argument to format the message with, see `log`
         """
-        return self.log(msg, LogLevel.TRACE)
+        return self.log(msg, LogLevel.TRACE, *args)
 
-    def debug(self, msg: str):
+    def debug(self, msg: str, *args):
         """
         log a message with `DEBUG` level
 
         ## Parameter:
         - `msg : str` : message to log
+        - `args` : argument to format the message with, see `log`
         """
-        return self.log(msg, LogLevel.DEBUG)
+        return self.log(msg, LogLevel.DEBUG, *args)
 
-    def info(self, msg: str):
+    def info(self, msg: str, *args):
         """
         log a message with `INFO` level
 
         ## Parameter:
         - `msg : str` : message to log
+        - `args` : argument to format the message with, see `log`
         """
-        return self.log(msg, LogLevel.INFO)
+        return self.log(msg, LogLevel.INFO, *args)
 
-    def warn(self, msg: str):
+    def warn(self, msg: str, *args):
         """
         log a message with `WARN` level
 
         ## Parameter:
         - `msg : str` : message to log
+        - `args` : argument to format the message with, see `log`
         """
-        return self.log(msg, LogLevel.WARN)
+        return self.log(msg, LogLevel.WARN, *args)
 
-    def error(self, msg: str):
+    def error(self, msg: str, *args):
         """
         log a message with `ERROR` level
 
         ## Parameter:
         - `msg : str` : message to log
+        - `args` : argument to format the message with, see `log`
         """
-        return self.log(msg, LogLevel.ERROR)
+        return self.log(msg, LogLevel.ERROR, *args)
 
 
 class ConsoleTarget(LogTarget):
@@ -265,6 +336,17 @@ class ConsoleTarget(LogTarget):
         GREEN = '\033[32m'
         RESET = '\033[0m'
 
+    _COLOR : tuple[tuple[str, str], ...] = (
+        ("", ""),
+        ("", ""),
+        (ConsoleColor.GREEN, ConsoleColor.RESET),
+        (ConsoleColor.YELLOW, ConsoleColor.RESET),
+        (ConsoleColor.RED, ConsoleColor.RESET),
+        ("", ""),
+    )
+    """opening and closing color code of each log level, indexed by level"""
+
+    __slots__ = ("name", "log_level", "__pad_size", "__prefix")
 
     def __init__(self, name:str, log_level: LogLevel= LogLevel.INFO):
         """
@@ -277,25 +359,20 @@ class ConsoleTarget(LogTarget):
         self.name : str = name
         self.log_level : LogLevel = log_level
         ConsoleTarget.NAME_PAD_SIZE = min(max(len(self.name), ConsoleTarget.NAME_PAD_SIZE),30)
+        self.__pad_size : int = -1
+        self.__prefix : str = ""
+        """padded name of the target, rebuilt when `NAME_PAD_SIZE` change"""
 
     def get_log_level(self) -> LogLevel:
         return self.log_level
 
     def log_to_target(self, msg: str, log_level: LogLevel):
 
-        msg = f"{self.name.ljust(ConsoleTarget.NAME_PAD_SIZE)} | {msg}"
-
-        cc = ConsoleTarget.ConsoleColor
-        match log_level:
-            case LogLevel.INFO:
-                msg = f"{cc.GREEN}{msg}{cc.RESET}"
-            case LogLevel.WARN:
-                msg = f"{cc.YELLOW}{msg}{cc.RESET}"
-            case LogLevel.ERROR:
-                msg = f"{cc.RED}{msg}{cc.RESET}"
-            case _:
-                pass
-        print(msg)
+        if self.__pad_size != ConsoleTarget.NAME_PAD_SIZE:
+            self.__pad_size = ConsoleTarget.NAME_PAD_SIZE
+            self.__prefix = f"{self.name.ljust(self.__pad_size)} | "
+        color, reset = ConsoleTarget._COLOR[log_level]
+        sys.stdout.write(f"{color}{self.__prefix}{msg}{reset}\n")
 
 class RollingFileTarget(LogTarget):
     """
@@ -341,9 +418,17 @@ class RollingFileTarget(LogTarget):
     `max_roll` specify the max number of file in rolling, 
     if the number of file exceed `max_roll` the oldest file will be discarded.
     thus keeping the all the log file never exceed a predeterminated size
+
+    ## Buffering
+    message are buffered in memory and written to the file
+    every `BUFFER_SIZE` bytes, when rolling, on `flush`, and on interpreter exit
     """
     ROOT_DIR : Optional[str] = os.environ.get("INOVO_LOG_DIR")
     """root directory of all log"""
+    BUFFER_SIZE : int = 64 * 1024
+    """size of the write buffer of the log file in bytes"""
+
+    __slots__ = ("name", "log_level", "max_roll", "max_size", "__f", "__size", "__weakref__")
 
     def __init__(
             self,
@@ -364,7 +449,10 @@ class RollingFileTarget(LogTarget):
         self.log_level : LogLevel = log_level
         self.max_roll : int = max_roll
         self.max_size : int = max_size
-        self.__f : Optional[IO] = None
+        self.__f : Optional[IO[bytes]] = None
+        self.__size : int = 0
+        """number of bytes written to the current log file"""
+        _FILE_TARGETS.add(self)
 
     @property
     def log_dir(self)->str:
@@ -384,15 +472,23 @@ class RollingFileTarget(LogTarget):
         if self.__f is None:
             self.roll()
 
-        f : IO = cast(IO, self.__f)
+        f : IO[bytes] = cast(IO[bytes], self.__f)
 
-        f.write(f"{msg}\n")
-        f.flush()
+        data = f"{msg}\n".encode("utf-8")
+        f.write(data)
+        self.__size += len(data)
 
-        if os.path.getsize(os.path.join(self.log_dir, f"{self.name}.0.log")) > self.max_size:
+        if self.__size > self.max_size:
             f.close()
             self.__f = None
 
+    def flush(self):
+        """
+        write all buffered message to the current log file
+        """
+        if self.__f is not None:
+            self.__f.flush()
+
     def roll(self):
         """
         roll all the log files
@@ -412,7 +508,94 @@ class RollingFileTarget(LogTarget):
             except FileNotFoundError:
                 pass
 
-        self.__f = open(os.path.join(self.log_dir, f"{self.name}.0.log"), "w", encoding="utf-8")
+        self.__f = open(
+            os.path.join(self.log_dir, f"{self.name}.0.log"),
+            "wb", buffering=RollingFileTarget.BUFFER_SIZE
+        )
+        self.__size = 0
 
     def __del__(self):
+        if self.__f is not None:
+            self.__f.close()
         self.__f = None
+
+_FILE_TARGETS : "weakref.WeakSet[RollingFileTarget]" = weakref.WeakSet()
+"""live `RollingFileTarget`, held weakly so a dropped target close its file"""
+
+@atexit.register
+def _flush_file_targets():
+    """flush every live `RollingFileTarget` on interpreter exit"""
+    for target in list(_FILE_TARGETS):
+        target.flush()
+
+
+class QueueTarget(LogTarget):
+    """
+    # QueueTarget
+    A class for handing log message off to a background thread,
+    which then log them to a wrapped target.
+
+    logging call on the caller thread become a single queue put,
+    the slow writing (console, files) is done by the background thread,
+    useful for tight control loop.
+
+    ## Usage
+    ```python
+    example_logger = Logger()
+    example_logger.add_target(QueueTarget(ConsoleTarget("Example")))
+    ```
+
+    ## Overflow
+    if more than `maxsize` message are pending, new message are dropped
+    instead of blocking the caller.
+
+    ## Stopping
+    the background thread is stopped after all pending message are logged,
+    on `stop`, when the target is garbage collected, or on interpreter exit.
+    """
+    __slots__ = ("target", "__queue", "__stop", "__weakref__")
+
+    def __init__(self, target: LogTarget, maxsize: int = 10_000):
+        """
+        initalize the target and start the background thread
+
+        ## Parameter
+        - `target : LogTarget` : the target to log to from the background thread
+        - `maxsize : int` : max number of pending message
+        """
+        self.target : LogTarget = target
+        self.__queue : queue.Queue[tuple[str, LogLevel] | None] = queue.Queue(maxsize=maxsize)
+        thread = threading.Thread(target=_drain, args=(self.__queue, target), daemon=True)
+        thread.start()
+        self.__stop : weakref.finalize = weakref.finalize(self, _stop_drain, self.__queue, thread)
+        """stop the background thread, hold no reference to the target so it can be collected"""
+
+    def get_log_level(self) -> LogLevel:
+        return self.target.get_log_level()
+
+    def log_to_target(self, msg: str, log_level: LogLevel):
+        try:
+            self.__queue.put_nowait((msg, log_level))
+        except queue.Full:
+            pass
+
+    def stop(self):
+        """
+        stop the background thread, after all pending message are logged
+        """
+        self.__stop()
+
+def _drain(queue_: "queue.Queue[tuple[str, LogLevel] | None]", target: LogTarget):
+    """log message from the queue to the target until `None` is received"""
+    while True:
+        record = queue_.get()
+        if record is None:
+            target.flush()
+            return
+        target.log_to_target(*record)
+
+def _stop_drain(queue_: "queue.Queue[tuple[str, LogLevel] | None]", thread: threading.Thread):
+    """stop a `_drain` thread, after all pending message are logged"""
+    if thread.is_alive():
+        queue_.put(None)
+        thread.join()
@@ -16,7 +16,7 @@ bot = InovoRobot.default_iva("psu000")
 ```
 """
 from contextlib import contextmanager
-import json
+import threading
 
 from inovopy.logger import Logger
 from inovopy.robridge import RosBridge
@@ -24,6 +24,37 @@ from inovopy.socket import TcpListener, TcpStream
 from inovopy.geometry.jointcoord import JointCoord
 from inovopy.geometry.transform import Transform
 from inovopy.iva import *
+from inovopy.utils import json_dumps
+
+_POP_BYTES : bytes = f"{json_dumps(pop())}\n".encode()
+"""encoded `pop` instruction, it never change"""
+_DEQUEUE_BYTES : tuple[bytes, bytes] = (
+    f"{json_dumps(dequeue(False))}\n".encode(),
+    f"{json_dumps(dequeue(True))}\n".encode(),
+)
+"""encoded `dequeue` instruction, indexed by `enter_context`"""
+
+def _prefix(instruction: dict[str, str|float]) -> str:
+    """encoded `instruction` left open, so more field can be appended"""
+    return json_dumps(instruction)[:-1] + ","
+
+_EXECUTE_PREFIX : tuple[str, str] = (
+    _prefix(execute(RobotCommand({}), enter_context=False)),
+    _prefix(execute(RobotCommand({}), enter_context=True)),
+)
+"""encoded fixed field of `execute` instruction, indexed by `enter_context`"""
+_ENQUEUE_PREFIX : str = _prefix(enqueue(RobotCommand({})))
+"""encoded fixed field of `enqueue` instruction"""
+
+def _encode(prefix: str, robot_command: RobotCommand) -> str:
+    """
+    encode an instruction from its encoded fixed field and a command,
+    same as encoding the instruction dict, without building it
+    """
+    argument = json_dumps(robot_command.argument)
+    if len(argument) <= 2:
+        return prefix[:-1] + "}"
+    return prefix + argument[1:]
 
 class IvaException(Exception):
     """
@@ -45,6 +76,13 @@ class InovoRobot:
     print(bot.get_current_jointcoord())
     ```
     """
+    __slots__ = ("tcp_stream", "ros_bridge", "logger")
+
+    _LISTENER : TcpListener | None = None
+    """listener shared by every `default_iva` call, created on first use, see `close_listener`"""
+    _LISTENER_LOCK : threading.Lock = threading.Lock()
+    """lock serializing `default_iva`, so each robot's connection go to its own call"""
+
     def __init__(
             self,
             tcp_stream : TcpStream,
@@ -61,24 +99,54 @@ class InovoRobot:
         """
         start the iva protocal by
 
-        - start up a tcp listener
+        - start up a tcp listener, shared by all call
+        - discard any connection left on the listener by an earlier call
         - start a sequence on psu via rosbridge
         - accept a connection
 
+        call from multiple thread are serialized, 
+        so that each call accept the connection from its own robot,
+        call `close_listener` to release the port when no more robot will connect
+
         ## Parameter:
         - `host: str` : remote host to start sequence, aka psu's address
 
         ## Return:
         `InovoRobot` : the resulted api class
         """
-        listener = TcpListener()
-        ros_bridge : RosBridge = RosBridge(host=host)
-        ros_bridge.start_seq("iva")
-        tcp_stream: TcpStream = listener.accept()
-        del listener
+        with InovoRobot._LISTENER_LOCK:
+            if InovoRobot._LISTENER is None:
+                InovoRobot._LISTENER = TcpListener()
+            InovoRobot._LISTENER.discard_pending()
+            ros_bridge : RosBridge = RosBridge(host=host)
+            ros_bridge.start_seq("iva")
+            tcp_stream: TcpStream = InovoRobot._LISTENER.accept()
         bot : InovoRobot = InovoRobot(tcp_stream=tcp_stream, ros_bridge=ros_bridge)
         return bot
 
+    @classmethod
+    def close_listener(cls):
+        """
+        close the listener shared by `default_iva`, releasing its port,
+        a `default_iva` blocked in accepting raise `SocketException`,
+        the next `default_iva` create a new listener
+        """
+        listener, InovoRobot._LISTENER = InovoRobot._LISTENER, None
+        if listener is not None:
+            listener.close()
+
+    def close(self):
+        """close the tcp connection to the robot and the rosbridge connection"""
+        self.tcp_stream.close()
+        if self.ros_bridge is not None:
+            self.ros_bridge.close()
+
+    def __enter__(self) -> 'InovoRobot':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def read(self) -> str:
         """read a line"""
         return self.tcp_stream.read()
@@ -90,14 +158,24 @@ class InovoRobot:
         ## Parameter:
         - `instruction : dict[str, str|float]` : jsonable instruction dict 
         """
-        msg = json.dumps(instruction)
-        self.tcp_stream.write(msg)
+        self.tcp_stream.write(json_dumps(instruction))
 
     def assert_res_ok(self):
         """read a message and assert that it is `OK`"""
-        res = self.read()
-        if res != "OK":
-            raise IvaException(f"Expect resopnse to be \"OK\", but recieve {res}")
+        res = self.tcp_stream.read_bytes()
+        if res != b"OK":
+            raise IvaException(f"Expect resopnse to be \"OK\", but recieve {res.decode()}")
+
+    def __assert_res_ok_n(self, n: int):
+        """
+        read `n` messages and assert that all of them are `OK`,
+        all `n` are read before raising, so later replies stay paired with their request
+        """
+        responses = [self.tcp_stream.read_bytes() for _ in range(n)]
+        failed = [(i, res) for i, res in enumerate(responses) if res != b"OK"]
+        if failed:
+            detail = ", ".join(f"step {i}: {res.decode()}" for i, res in failed)
+            raise IvaException(f"Expect resopnse to be \"OK\", but recieve {detail}")
 
     def execute(self, robot_command: RobotCommand, enter_context: bool = False):
         """
@@ -110,7 +188,7 @@ class InovoRobot:
         ## Exception:
         `IvaException` raise if response is not `OK`
         """
-        self.write(execute(robot_command=robot_command, enter_context=enter_context))
+        self.tcp_stream.write(_encode(_EXECUTE_PREFIX[enter_context], robot_command))
         self.assert_res_ok()
 
     def sleep(self, second: float):
@@ -173,7 +251,7 @@ class InovoRobot:
         ## Parameter
         - `robot_command: inovopy.iva.RobotCommand`: the command to enqueue
         """
-        self.write(enqueue(robot_command=robot_command))
+        self.tcp_stream.write(_encode(_ENQUEUE_PREFIX, robot_command))
         self.assert_res_ok()
 
     def dequeue(self, enter_context: bool = False):
@@ -183,25 +261,36 @@ class InovoRobot:
         ## Parameter
         - `enter_context: bool`: whether enter a context with the sequence or not
         """
-        self.write(dequeue(enter_context=enter_context))
+        self.tcp_stream.write_bytes(_DEQUEUE_BYTES[enter_context])
         self.assert_res_ok()
 
-    def sequence(self, sequence: list[RobotCommand], enter_context: bool = False):
+    def sequence(
+            self,
+            sequence: list[RobotCommand],
+            enter_context: bool = False,
+            pipeline: bool = False
+        ):
         """
         perform a sequence of `inovopy.iva.RobotCommand`
 
         ## Parameter
         - `enter_context: bool`: whether enter a context with the sequence or not
-        """
-        for step in sequence:
-            self.enqueue(step)
+        - `pipeline: bool`: send all the enqueue instruction in one write,
+        and then wait for all the `OK`, instead of one round trip per step
+        """
+        if pipeline and sequence:
+            self.tcp_stream.write("\n".join(_encode(_ENQUEUE_PREFIX, step) for step in sequence))
+            self.__assert_res_ok_n(len(sequence))
+        else:
+            for step in sequence:
+                self.enqueue(step)
         self.dequeue(enter_context=enter_context)
 
     def pop(self):
         """
         exit a context
         """
-        self.write(pop())
+        self.tcp_stream.write_bytes(_POP_BYTES)
         self.assert_res_ok()
 
     def io(self, io_command : IOCommand):
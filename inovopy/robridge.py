@@ -15,39 +15,63 @@ api to command and get state from inovo arm
 ## Exception
 - `RosBridgeExcpetion` : all ros bridge related exception
 """
-import json
 import socket
 import asyncio
+import concurrent.futures
+import weakref
+import itertools
+import threading
+from typing import Any, Coroutine, cast
 import websockets
-import nest_asyncio
+from websockets.protocol import State
+
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
 
 from inovopy.logger import Logger
+from inovopy.utils import json_dumps, json_loads
+
+_RUN_TIME_JSON : str = json_dumps({
+    "op": "subscribe",
+    "topic": "/sequence/runtime_state",
+    "type": "commander_msgs/RuntimeState",
+})
+_ARM_STATE_JSON : str = json_dumps({
+    "op": "subscribe",
+    "topic": "/robot/arm_state",
+    "type": "arm_msgs/ArmState",
+})
+_STOP_SEQ_JSON : str = json_dumps({
+    "op" : "call_service",
+    "service": "/sequence/stop",
+    "id": "call_service:/sequence/stop",
+    "type": "std_srvs/Trigger",
+    "args": {}
+})
+_START_SEQ_HEAD, _START_SEQ_TAIL = json_dumps({
+    "op": "call_service",
+    "service": "/sequence/start",
+    "id": "sequencer/RunSequence",
+    "args": {
+        "procedure_name" : None
+    }
+}).split("null")
+"""start sequence message, split where the encoded sequence name goes"""
 
 def run_time_json()->str:
     """construct rosbridge message for reading runtime state"""
-    return json.dumps({
-        "op": "subscribe",
-        "topic": "/sequence/runtime_state",
-        "type": "commander_msgs/RuntimeState",
-    })
+    return _RUN_TIME_JSON
 
 def arm_state_json()->str:
     """construct rosbridge message for reading arm state"""
-    return json.dumps({
-            "op": "subscribe",
-            "topic": "/robot/arm_state",
-            "type": "arm_msgs/ArmState",
-    })
+    return _ARM_STATE_JSON
 
 def stop_seq_json() -> str:
     """construct rosbridge messagee for stopping sequence"""
-    return json.dumps({
-        "op" : "call_service",
-        "service": "/sequence/stop",
-        "id": "call_service:/sequence/stop",
-        "type": "std_srvs/Trigger",
-        "args": {}
-    })
+    return _STOP_SEQ_JSON
 
 def start_seq_json(sequence: str) -> str:
     """
@@ -56,25 +80,161 @@ def start_seq_json(sequence: str) -> str:
     ## Parameter
     - sequence: str` : name of sequence(function name) in inovo blocky run time to start
     """
-    return json.dumps({
-        "op": "call_service",
-        "service": "/sequence/start",
-        "id": "sequencer/RunSequence",
-        "args": {
-            "procedure_name" : sequence
-        }
-    })
+    return f"{_START_SEQ_HEAD}{json_dumps(sequence)}{_START_SEQ_TAIL}"
+
+_CALL_IDS : itertools.count = itertools.count()
+"""counter making the `id` assigned to requests sent without one unique"""
+
+def _request_key(msg: dict) -> tuple[str, str] | None:
+    """
+    key of the response a rosbridge request wait for,
+    the `id` for service calls, the `topic` for subscriptions,
+    `None` for operation without a reply, e.g. `publish`, `unsubscribe`
+    """
+    op = msg.get("op")
+    if op == "call_service":
+        return ("id", msg.get("id"))
+    if op == "subscribe":
+        return ("topic", msg["topic"])
+    return None
+
+def _response_key(msg: dict) -> tuple[str, str] | None:
+    """key of a rosbridge response, matching `_request_key` of its request"""
+    op = msg.get("op")
+    if op == "service_response":
+        return ("id", msg.get("id"))
+    if op == "publish":
+        return ("topic", msg.get("topic"))
+    return None
+
+async def _cancel_tasks():
+    """cancel every other task on the running loop and wait for them to finish"""
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+def _stop_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread):
+    """cancel what is left on a `RosBridge` event loop, then stop and close it"""
+    if thread is threading.current_thread():
+        loop.call_soon(loop.stop)
+        return
+    if thread.is_alive():
+        asyncio.run_coroutine_threadsafe(_cancel_tasks(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+    loop.close()
 
 class RosBridgeException(Exception):
     """
     ROS Bridge related exception
     """
 
+class _Connection:
+    """
+    a websocket connection of `RosBridge`,
+    with the futures waiting for its responses and the topics subscribed on it
+
+    it hold no reference to its `RosBridge`,
+    so its reader task does not keep the `RosBridge` alive
+    """
+    __slots__ = ("websocket", "waiters", "ids", "topics", "closed")
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.waiters : dict[tuple[str, str], list[asyncio.Future]] = {}
+        """futures waiting for a response, by the response's `_response_key`"""
+        self.ids : dict[str, tuple[str, str]] = {}
+        """`_request_key` of the waited requests by their `id`, to pair error status"""
+        self.topics : set[str] = set()
+        """topics subscribed on the connection, kept subscribed for later reads"""
+        self.closed : bool = False
+        """whether the connection ended, every waiter have failed once it is"""
+
+    @property
+    def usable(self) -> bool:
+        """whether requests can still be sent over the connection"""
+        return not self.closed and self.websocket.state is State.OPEN
+
+    async def read(self):
+        """hand every message received to its waiters, until the connection is closed"""
+        try:
+            async for raw in self.websocket:
+                res = json_loads(raw)
+                if res.get("op") == "status":
+                    self.__status(res)
+                    continue
+                key = _response_key(res)
+                if key is None:
+                    continue
+                for future in self.waiters.pop(key, ()):
+                    if not future.done():
+                        future.set_result(res)
+        except websockets.ConnectionClosed:
+            pass
+        self.fail(RosBridgeException("Websocket Connection Closed"))
+
+    def __status(self, res: dict):
+        """fail the request an error status is about, rosbridge send no other reply for it"""
+        if res.get("level") != "error":
+            return
+        key = self.ids.get(res.get("id"))
+        if key is None:
+            return
+        if key[0] == "topic":
+            self.topics.discard(key[1])
+        for future in self.waiters.pop(key, ()):
+            if not future.done():
+                future.set_exception(RosBridgeException(f"rosbridge error : {res.get('msg')}"))
+
+    def wait(self, key: tuple[str, str], id_: str) -> asyncio.Future:
+        """return a future for the response of `key`, to the request `id_`"""
+        future = asyncio.get_running_loop().create_future()
+        if self.closed:
+            future.set_exception(RosBridgeException("Websocket Connection Closed"))
+        else:
+            self.waiters.setdefault(key, []).append(future)
+            self.ids[id_] = key
+        return future
+
+    def forget(self, key: tuple[str, str], future: asyncio.Future, id_: str):
+        """stop `future` waiting for the response of `key`, to the request `id_`"""
+        self.ids.pop(id_, None)
+        futures = self.waiters.get(key, [])
+        if future in futures:
+            futures.remove(future)
+        if not futures:
+            self.waiters.pop(key, None)
+
+    def fail(self, e: Exception):
+        """end the connection's use, every waiting future fail with `e`"""
+        self.closed = True
+        self.topics.clear()
+        waiters, self.waiters = self.waiters, {}
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+
 class RosBridge:
     """
     # RosBridge
     A class managing rosbridge api communication
 
+    one websocket connection is made on first use and kept open, 
+    it is reconnected if the server closed it while idle,
+    call `close` when done, or use it as a context manager
+
+    reading a state subscribe to its topic once, with `queue_length` 1,
+    the subscription is kept open, later read return
+    the next message of the topic after they are made
+
+    the connection is served by an event loop on a background thread,
+    (`uvloop` if installed), so calls work the same with or without
+    a running event loop in the caller, and from multiple threads,
+    calls from multiple threads are in flight at once over the one connection,
+    their responses are paired by service call `id` and subscription `topic`
+
     ## Usage
     ```python
     from inovopy.rosbrige import RosBridge
@@ -84,6 +244,8 @@ class RosBridge:
     run_time_state = my_ros_bridge.get_run_time_state()
     arm_state = my_ros_bridge.get_arm_state()
 
+    run_time_state, arm_state = my_ros_bridge.batch([run_time_json(), arm_state_json()])
+
     my_ros_bridge.start_seq("my function")
     my_ros_bridge.stop_seq()
     ```
@@ -91,7 +253,8 @@ class RosBridge:
     def __init__(
             self,
             host: str,
-            logger: Logger | None = None
+            logger: Logger | None = None,
+            timeout: float = 5.0
         ):
         """
         initalize `RosBridge`
@@ -99,44 +262,160 @@ class RosBridge:
         ## Parameter
         - `host : str` : host of psu, preferably in form of `192.168.x.x`
         - `logger: Logger | None` : logger, if default if None
+        - `timeout : float` : seconds a call wait for its responses
         """
-        nest_asyncio.apply()
         self.url : str = f"ws://{host}:9090/"
+        self.timeout : float = timeout
+        """seconds a call wait for its responses before `RosBridgeException` is raised"""
+        self.__conn : _Connection | None = None
+        """persistent websocket connection, connected on first use"""
+        self.__loop : asyncio.AbstractEventLoop = _new_event_loop()
+        """event loop serving the connection, run by a background thread"""
+        self.__connecting : asyncio.Lock = asyncio.Lock()
+        """lock so concurrent exchanges connect once and share the connection"""
+        thread = threading.Thread(target=self.__loop.run_forever, daemon=True)
+        thread.start()
+        self.__stop_loop : weakref.finalize = weakref.finalize(
+            self, _stop_loop, self.__loop, thread
+        )
+        """stop the event loop and its thread, on `close` or once garbage collected"""
         self.logger: Logger = logger if logger else Logger.default(f"RosBridge {host}")
-        self.logger.info(f"ros bridge initalized with url : {self.url}")
+        self.logger.info("ros bridge initalized with url : %s", self.url)
         if not "192.168" in self.url:
             self.logger.warn("host is not in form of 192.168.x.x")
             self.logger.warn("this might cause networking errors")
 
-    async def __websocket(self, req: str) -> dict:
+    async def __connect(self) -> _Connection:
+        """get the persistent websocket connection, connect if there is none"""
+        async with self.__connecting:
+            return await self.__connect_locked()
+
+    async def __connect_locked(self) -> _Connection:
+        """`__connect` with sole use of `__conn`"""
+        if self.__conn is not None:
+            # let the connection process anything received while idle, e.g. a close
+            await asyncio.sleep(0)
+            if self.__conn is not None and not self.__conn.usable:
+                self.__conn.fail(RosBridgeException("Websocket Connection Closed"))
+                self.__conn = None
+        if self.__conn is None:
+            self.logger.debug("........trying to connect to websocket . . .")
+            try:
+                # rosbridge message are small json, deflating them cost more than it save
+                websocket = await websockets.connect(self.url, compression=None)
+            except (ConnectionRefusedError, socket.gaierror) as e:
+                self.logger.error(f"Cannot Connect Websocket due to connection refused error : {e}")
+                self.logger.error("this error might be cause by host name not being not a ip address")
+                self.logger.error("please retry with 192.168.x.x form ip as host")
+                raise RosBridgeException("Websocket Connection Error") from e
+            self.__conn = _Connection(websocket)
+            asyncio.get_running_loop().create_task(self.__conn.read())
+            self.logger.debug("........connection successful")
+        return self.__conn
+
+    async def __exchange(self, reqs: list[str]) -> list[dict | None]:
         """
-        async routine for creating a websocket, 
-        sending message and get response
+        async routine for sending all messages over the persistent websocket
+        and get all responses
+
+        topic already subscribed on the connection are not subscribed again,
+        the next message of the topic is its response
+
+        exchanges run concurrently over the one connection,
+        each waiting only for the responses to its own messages
 
         ## Parameter:
-        - `req : str` : json message to send
+        - `reqs : list[str]` : json messages to send
 
         ## Return:
-        `dict` response parse into dict
+        `list[dict | None]` responses parse into dict, in the order of `reqs`,
+        `None` for messages without a reply
         """
-        self.logger.debug("........trying to connect to websocket . . .")
+        if not reqs:
+            return []
+        conn = await self.__connect()
+        waiting : list[tuple[tuple[str, str], asyncio.Future, str] | None] = []
         try:
-            async with websockets.connect(self.url) as websocket:
-                self.logger.debug("........connection successful, sending message . . .")
-                await websocket.send(req)
+            self.logger.debug("........sending messages . . .")
+            for req in reqs:
+                msg = json_loads(req)
+                op = msg.get("op")
+                key = _request_key(msg)
+                if key is None:
+                    waiting.append(None)
+                else:
+                    if "id" not in msg:
+                        # an error status name the request only by its `id`
+                        msg["id"] = f"{op}:{msg.get('service', msg.get('topic'))}:{next(_CALL_IDS)}"
+                        key = _request_key(msg)
+                        req = json_dumps(msg)
+                    waiting.append((key, conn.wait(key, msg["id"]), msg["id"]))
+                if op == "subscribe":
+                    if msg["topic"] in conn.topics:
+                        continue
+                    # rosbridge keep only the newest message for us, none is left stale
+                    msg.setdefault("queue_length", 1)
+                    req = json_dumps(msg)
+                    conn.topics.add(msg["topic"])
+                await conn.websocket.send(req)
+
+            self.logger.debug("........reading messages . . .")
+            return [await item[1] if item else None for item in waiting]
+        except websockets.ConnectionClosed as e:
+            conn.fail(RosBridgeException("Websocket Connection Closed"))
+            self.logger.error(f"Websocket connection closed : {e}")
+            raise RosBridgeException("Websocket Connection Closed") from e
+        except RosBridgeException as e:
+            self.logger.error(f"{e}")
+            raise
+        finally:
+            for item in waiting:
+                if item:
+                    conn.forget(*item)
 
-                self.logger.debug("........reading message . . .")
-                res = await websocket.recv()
-                res = json.loads(res)
-                return res
-        except (ConnectionRefusedError, socket.gaierror) as e:
-            self.logger.error(f"Cannot Connect Websocket due to connection refused error : {e}")
-            self.logger.error("this error might be cause by host name not being not a ip address")
-            self.logger.error("please retry with 192.168.x.x form ip as host")
-            raise RosBridgeException("Websocket Connection Error") from e
+    async def __close(self):
+        async with self.__connecting:
+            conn, self.__conn = self.__conn, None
+            if conn is not None:
+                conn.fail(RosBridgeException("RosBridge is closed"))
+                await conn.websocket.close()
 
+    def close(self):
+        """
+        close the persistent websocket connection, if any,
+        and stop the background event loop,
+        the `RosBridge` cannot be used afterward
+        """
+        if not self.__stop_loop.alive:
+            return
+        self.__run(self.__close())
+        self.__stop_loop()
+
+    def __enter__(self) -> 'RosBridge':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        run a coroutine on the background event loop and wait for its result,
+        raise `RosBridgeException` if the `RosBridge` is closed,
+        or the result is not ready within `timeout`
+        """
+        if not self.__stop_loop.alive:
+            coro.close()
+            raise RosBridgeException("RosBridge is closed")
+        future = asyncio.run_coroutine_threadsafe(coro, self.__loop)
+        try:
+            return future.result(self.timeout)
+        except (concurrent.futures.TimeoutError, asyncio.TimeoutError) as e:
+            # cancelling stop the exchange waiting, its futures are forgotten
+            future.cancel()
+            self.logger.error("no response within %s s", self.timeout)
+            raise RosBridgeException(f"No response within {self.timeout} s") from e
 
-    def websocket(self, req: str) -> dict:
+    def websocket(self, req: str) -> dict | None:
         """
         sending message and get response
 
@@ -144,13 +423,47 @@ class RosBridge:
         - `req : str` : json message to send
 
         ## Return:
-        `dict` response parse into dict
+        `dict` response parse into dict; or
+        `None` if the operation has no reply, e.g. `publish`, `unsubscribe`
+
+        ## Exception:
+        `RosBridgeException` : if rosbridge reply with an error status,
+        or no response is received within `timeout`
         """
-        self.logger.debug(f"....req : {req}")
-        res = asyncio.get_event_loop().run_until_complete(self.__websocket(req))
-        self.logger.debug(f"....res : {res}")
+        self.logger.debug("....req : %s", req)
+        res = self.__run(self.__exchange([req]))[0]
+        self.logger.debug("....res : %s", res)
         return res
 
+    def batch(self, reqs: list[str]) -> list[dict | None]:
+        """
+        sending multiple messages at once and get all responses
+
+        responses are paired with requests by `id` for `call_service`,
+        and by `topic` for `subscribe`, a unique `id` is assigned
+        to both if they have none, to pair an error status with them,
+        other operation get no reply, and are not waited for
+
+        ## Parameter:
+        - `reqs : list[str]` : json messages to send, e.g. from `start_seq_json`
+
+        ## Return:
+        `list[dict | None]` responses parse into dict, in the order of `reqs`,
+        `None` for messages without a reply
+
+        ## Exception:
+        `RosBridgeException` : if rosbridge reply to any of them with an error status,
+        or not all response are received within `timeout`
+        """
+        self.logger.debug("....reqs : %s", reqs)
+        res = self.__run(self.__exchange(reqs))
+        self.logger.debug("....res : %s", res)
+        return res
+
+    def __reply(self, req: str) -> dict:
+        """`websocket` for a message which always get a reply"""
+        return cast(dict, self.websocket(req))
+
     def get_run_time_state(self) -> dict:
         """
         get the runtime state
@@ -159,7 +472,7 @@ class RosBridge:
         `dict` return message representing runtime state
         """
         self.logger.info("getting run time state . . .")
-        return self.websocket(run_time_json())
+        return self.__reply(run_time_json())
 
     def get_arm_state(self) -> dict:
         """
@@ -169,12 +482,12 @@ class RosBridge:
         `dict` return message representing arm state
         """
         self.logger.info("getting arm state . . .")
-        return self.websocket(arm_state_json())
+        return self.__reply(arm_state_json())
 
     def stop_seq(self):
         """stop sequence"""
         self.logger.info("stopping robot sequence . . .")
-        if not self.websocket(stop_seq_json())["values"]["success"]:
+        if not self.__reply(stop_seq_json())["values"]["success"]:
             self.logger.error("failed to stop robot sequence")
             raise RosBridgeException("Failed to stop sequence")
 
@@ -185,7 +498,7 @@ class RosBridge:
         ## Parameter:
         - `seq: str` : name of the function to call
         """
-        self.logger.info(f"starting robot sequence {seq} . . .")
-        if not self.websocket(start_seq_json(seq))["values"]["success"]:
+        self.logger.info("starting robot sequence %s . . .", seq)
+        if not self.__reply(start_seq_json(seq))["values"]["success"]:
             self.logger.error("failed to start robot sequence")
             raise RosBridgeException("Failed to start sequence")
@@ -5,8 +5,11 @@ This module provide an api class for listening tcp connection
 ## Classes
 - `TcpListener` : a class for managing and listening connection
 """
+import sys
 import socket
-import select
+import weakref
+import selectors
+from collections import deque
 
 from inovopy.socket.utils import SocketException, auto_detect_ips
 from inovopy.socket.tcp_stream import TcpStream
@@ -24,6 +27,12 @@ class TcpListener:
     example_listener = TcpListener()
 
     example_stream = example_listener.accept()
+
+    example_listener.close()
+
+    with TcpListener() as listener:
+        with listener.accept() as stream:
+            stream.write("send a message")
     ```
         
     """
@@ -31,6 +40,9 @@ class TcpListener:
     DEFAULT_PORT : int = 50003
     """Default port to listen on if no poort are specified `50003`."""
 
+    _SELECT_TIMEOUT : float | None = 1.0 if sys.platform == "win32" else None
+    """selector timeout, windows need to wake up periodically for `Ctrl-C`"""
+
     def __init__(
             self,
             host: str | None = None,
@@ -80,45 +92,53 @@ class TcpListener:
         self.__sockets : list[socket.socket] = []
         """a list of socket to listen to"""
 
-        for ip in ips:
-            self.logger.debug(f"ip : {ip}")
-            soc : socket.socket= socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__selector : selectors.BaseSelector = selectors.DefaultSelector()
+        """selector to wait for incoming connection"""
 
-            self.logger.debug("....setting socket option")
-            soc.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.__wakeup, self.__waker = socket.socketpair()
+        """socket pair to wake up `accept` when the listener is closed"""
+        self.__selector.register(self.__wakeup, selectors.EVENT_READ)
 
-            self.logger.debug("....trying to bind . . .")
-            try:
-                soc.bind((ip,port))
-                self.logger.debug("....socket binding successful.")
-            except OSError as e:
-                self.logger.warn(f"Failed to bind @ {ip}:{port}")
-                self.logger.warn(f"Error: {e}")
-                continue
+        self.__pending : deque[socket.socket] = deque()
+        """accepted connection not yet returned by `accept`"""
 
-            self.logger.debug("....trying to listen . . .")
+        for ip in ips:
+            self.logger.debug("ip : %s", ip)
+
+            self.logger.debug("....trying to bind and listen . . .")
             try:
-                soc.listen()
+                # SO_REUSEADDR is set where it is safe, i.e. not on windows
+                soc : socket.socket = socket.create_server((ip,port), family=socket.AF_INET)
                 self.logger.debug("....socket start listening . . .")
             except OSError as e:
-                self.logger.warn(f"Failed to listen @ {ip}:{port}")
-                self.logger.warn(f"{e}")
+                self.logger.warn(f"Failed to bind and listen @ {ip}:{port}")
+                self.logger.warn(f"Error: {e}")
                 continue
 
+            # non blocking, so all waiting connection can be accepted until none is left
             soc.setblocking(False)
 
-            self.logger.info(f"Finished setting up socket @ {ip}:{port}")
+            self.logger.info("Finished setting up socket @ %s:%s", ip, port)
             self.__sockets.append(soc)
+            self.__selector.register(soc, selectors.EVENT_READ)
 
 
         if len(self.__sockets) == 0:
             self.logger.error("No vaild socket created.")
             raise SocketException("No vaild socket created.")
 
+        weakref.finalize(
+            self, _release, self.__selector,
+            [self.__wakeup, self.__waker, *self.__sockets], self.__pending
+        )
+
     def accept(self, stream_logger : Logger | None = None) -> TcpStream:
         """
         try accept a new tcp connection.
 
+        every connection already waiting is accepted at once,
+        the rest are returned by the following calls without waiting
+
         ## Parameter:
         `stream_logger : Logger` : logger of returned TcpStream
         
@@ -126,44 +146,93 @@ class TcpListener:
         `TcpStream` : the accepted tcp connetion
 
         ## Exception:
-        No exception, will continue to try to accept if encounter `OSError`
+        `SocketException` : if the listener is closed while accepting,
+        will continue to try to accept if encounter `OSError`
         """
         self.logger.info("Start accepting . . .")
 
         self.logger.debug("waiting for connection . . .")
-        while True:
-            readables, _, _ = select.select(self.__sockets,[],[],1)
+        while not self.__pending:
+            events = self.__selector.select(TcpListener._SELECT_TIMEOUT)
 
-            for soc in readables:
-                if soc not in self.__sockets:
-                    self.logger.debug("....readables not in self.__sockets")
-                    continue
+            for key, _ in events:
+                soc : socket.socket = key.fileobj
+                if soc is self.__wakeup:
+                    self.logger.info("TcpListener closed, stop accepting")
+                    raise SocketException("TcpListener closed")
 
-                (ip,port) = soc.getsockname()
+                self.__accept_all(soc)
 
-                self.logger.info(f"trying to accept connection at {ip}:{port}")
+        return TcpStream(self.__pending.popleft(), stream_logger)
 
-                try:
-                    accept = soc.accept()
-                    conn : socket.socket = accept[0]
-                    peer_ip, peer_port = accept[1]
-                    self.logger.info(f"Accepting connect successful to {peer_ip}:{peer_port}")
-                except OSError as e:
-                    self.logger.warn("Accepting connection failed")
-                    self.logger.warn(f"{e}")
-                    continue
+    def __accept_all(self, soc: socket.socket):
+        """accept every connection waiting on a listening socket into `__pending`"""
+        (ip,port) = soc.getsockname()
 
-                stream = TcpStream(conn, stream_logger)
-                return stream
+        self.logger.info("trying to accept connection at %s:%s", ip, port)
 
+        while True:
+            try:
+                conn, (peer_ip, peer_port) = soc.accept()
+            except BlockingIOError:
+                return
+            except OSError as e:
+                self.logger.warn("Accepting connection failed")
+                self.logger.warn(f"{e}")
+                return
+
+            self.logger.info("Accepting connect successful to %s:%s", peer_ip, peer_port)
+            self.__pending.append(conn)
+
+    def discard_pending(self):
+        """
+        close every connection waiting to be accepted without waiting for new one,
+        e.g. connection left over by an earlier attempt that failed before `accept`
+        """
+        for soc in self.__sockets:
+            self.__accept_all(soc)
+        if self.__pending:
+            self.logger.info("discarding %s stale connection", len(self.__pending))
+        while self.__pending:
+            self.__pending.popleft().close()
 
-    def __del__(self):
+    def close(self):
+        """
+        close all listening socket and connection not yet accepted,
+        wake up any thread blocking in `accept`
+        """
+        if self.__waker.fileno() == -1:
+            return
+        self.__waker.close()
+        while self.__pending:
+            self.__pending.popleft().close()
         for soc in self.__sockets:
             try:
                 (ip,port) = soc.getsockname()
-                self.logger.debug(f"shutting down socket @ {ip}:{port}")
+                self.logger.debug("shutting down socket @ %s:%s", ip, port)
                 soc.close()
             except OSError as e:
                 self.logger.error("Failed to shut down socket!")
                 self.logger.error(f"{e}")
                 continue
+
+    def __enter__(self) -> 'TcpListener':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _release(
+        selector: selectors.BaseSelector,
+        sockets: list[socket.socket],
+        pending: deque[socket.socket]
+    ):
+    """
+    release everything a `TcpListener` hold once it is garbage collected,
+    unlike `__del__`, this does not keep the listener alive in a reference cycle
+    """
+    selector.close()
+    for soc in sockets:
+        soc.close()
+    for conn in pending:
+        conn.close()
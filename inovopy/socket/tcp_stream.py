@@ -7,11 +7,29 @@ This module provide an api class for managing tcp connection
 """
 import socket
 import select
+import time
 
 from inovopy.socket.utils import SocketException, auto_detect_ips
-from inovopy.utils import clean
 from inovopy.logger import Logger
 
+_NON_VISIBLE : bytes = bytes(b for b in range(256) if not 0x20 <= b <= 0x7e)
+"""bytes removed from a read message, same as `inovopy.utils.clean` on the decoded str"""
+
+_SOCKET_OPTIONS : list[tuple[int, int, int]] = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (
+        ("TCP_KEEPIDLE", 5),
+        ("TCP_KEEPINTVL", 1),
+        ("TCP_KEEPCNT", 5),
+        ("TCP_USER_TIMEOUT", 5000),
+    )
+    if hasattr(socket, name)
+]
+"""`(level, option, value)` set on every connection, those not supported by the platform are skipped"""
+
 class TcpStream:
     """
     # TcpStream
@@ -28,6 +46,8 @@ class TcpStream:
     example_stream.write("send a message")
 
     read_message = example_stream.read()
+
+    example_stream.close()
     ```
     """
     def __init__(
@@ -41,8 +61,31 @@ class TcpStream:
         ## Parameter
         - `conn : socket.socket` : the socket connection
         - `logger` : if it's `None`, a logger with default setting will be created
+
+        `TCP_NODELAY` is set on the connection, so a small message
+        is sent right away instead of waiting to be coalesced (Nagle's algorithm)
+
+        TCP keepalive is enabled, probing after 5s idle where supported,
+        so `read` fails within seconds on a dead peer instead of blocking forever
+
+        the connection is put in blocking mode once here,
+        it is not changed by `read` or `try_read`
+
+        messages are framed by newline, as the iva runtime terminate each write with `LF`
         """
         self.__conn : socket.socket = conn
+        self.__buffer : bytes = b""
+        """received bytes after the last returned line"""
+        self.__sock_recv = conn.recv
+        """bound `conn.recv`, resolved once for the read path"""
+        self.__sock_sendall = conn.sendall
+        """bound `conn.sendall`, resolved once for the write path"""
+        self.__conn.setblocking(True)
+        for level, option, value in _SOCKET_OPTIONS:
+            try:
+                self.__conn.setsockopt(level, option, value)
+            except OSError:
+                pass
         if logger:
             self.logger : Logger = logger
         else:
@@ -84,7 +127,7 @@ class TcpStream:
         try:
             conn = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             conn.connect((ip,port))
-            logger.info(f"Successfully connected to {ip}:{port}")
+            logger.info("Successfully connected to %s:%s", ip, port)
             return TcpStream(conn=conn, logger=logger)
         except OSError as e:
             logger.warn("Failed to connect")
@@ -104,11 +147,18 @@ class TcpStream:
         
         ## Return
         `str` : read message; or
-        `None` : if no message is recived
+        `None` : if no complete message is recived within `timeout`,
+        bytes already received are kept for the next read
         """
-        ready_socket, _, _ = select.select([self.__conn],[],[],timeout)
-        if not ready_socket:
-            return None
+        deadline = time.monotonic() + timeout
+        while b"\n" not in self.__buffer:
+            remain = deadline - time.monotonic()
+            if remain <= 0:
+                return None
+            ready_socket, _, _ = select.select([self.__conn],[],[],remain)
+            if not ready_socket:
+                return None
+            self.__fill()
         return self.read()
 
 
@@ -116,7 +166,7 @@ class TcpStream:
         """
         read a message form the connection
 
-        maximum byte : `2048`
+        one line is read, without its newline
 
         ## Return:
         `str` the message read
@@ -126,9 +176,44 @@ class TcpStream:
         - if the read failed
         - if `EOF` character is read
         """
+        s = self.__recv().decode("ascii")
+        self.logger.debug("....%s", s)
+
+        return s
+
+    def read_bytes(self) -> bytes:
+        """
+        read a message form the connection without decoding it,
+        cheaper than `read` when only comparing against a known reply
+
+        one line is read, without its newline
+
+        ## Return:
+        `bytes` the message read, only visible ascii character are kept
+
+        ## Exception:
+        `SocketException`:
+        - if the read failed
+        - if `EOF` character is read
+        """
+        data = self.__recv()
+        self.logger.debug("....%s", data)
+
+        return data
+
+    def __recv(self) -> bytes:
+        """receive a line and remove non visible character"""
+        while True:
+            line, newline, rest = self.__buffer.partition(b"\n")
+            if newline:
+                self.__buffer = rest
+                return line.translate(None, _NON_VISIBLE)
+            self.__fill()
+
+    def __fill(self):
+        """receive once from the connection into the buffer"""
         try:
-            self.__conn.setblocking(True)
-            data = self.__conn.recv(2048)
+            data = self.__sock_recv(2048)
         except OSError as e:
             self.logger.error("Error occur during socket read!")
             self.logger.error(f"{e}")
@@ -139,10 +224,7 @@ class TcpStream:
             self.logger.error("Read Error : EOF detected")
             raise SocketException("Read Error : EOF detected")
 
-        s = clean(data.decode("UTF-8"))
-        self.logger.debug(f"....{s}")
-
-        return s
+        self.__buffer += data
 
     def write(self, msg: str):
         """
@@ -151,22 +233,40 @@ class TcpStream:
         ## Parameter:
         - `msg : str` : string message to send
         """
+        self.logger.debug("%s", msg)
+        self.__send(f"{msg}\n".encode())
+
+    def write_bytes(self, data: bytes):
+        """
+        write an already encoded message to the connection,
+        unlike `write`, no newline is appended
+
+        ## Parameter:
+        - `data : bytes` : encoded message to send, including its newline
+        """
+        self.logger.debug("%s", data)
+        self.__send(data)
+
+    def __send(self, data: bytes):
+        """send all of data, raise `SocketException` on failure"""
         try:
-            self.logger.debug(f"{msg}")
-            msg = f"{msg}\n"
-            self.__conn.send(msg.encode())
+            self.__sock_sendall(data)
         except Exception as e:
             self.logger.error("Error occur during socket write!")
             self.logger.error(f"{e}")
             raise SocketException("Write Error") from e
 
-    def __del__(self):
+    def close(self):
+        """close the connection, closing it again has no effect"""
+        self.logger.debug("closing socket")
         try:
-            self.logger.debug("closing socket")
             self.__conn.close()
         except OSError as e:
-            try:
-                self.logger.error("Failed to shut down socket!")
-                self.logger.error(f"{e}")
-            except OSError:
-                pass
+            self.logger.error("Failed to shut down socket!")
+            self.logger.error(f"{e}")
+
+    def __enter__(self) -> 'TcpStream':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
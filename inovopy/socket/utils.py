@@ -6,19 +6,63 @@ This module provide an api class for listening tcp connection
 - `SocketExecption` : An Excpetion Class for all socket related exception
 
 ## Function
-- `auto_detect_ips` : detect ip of local machine
+- `auto_detect_ips` : detect ip of local machine, cached
+- `clear_ip_cache` : forget the ip detected, e.g. after the network changed
 """
 
 import socket
 import platform
+from functools import lru_cache
 from inovopy.logger import Logger
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+_IS_LINUX : bool = platform.system() == "Linux"
+"""whether this machine run linux, checked once at import"""
+
 class SocketException(Exception):
     """socket commuication exception"""
 
 class EndOfCommunication(Exception):
     """end of communication exception"""
 
+def _usable(ip: str) -> bool:
+    """whether `ip` may be a local network ip, loopback and link-local are not"""
+    return not ip.startswith(("127.", "169.254."))
+
+@lru_cache(maxsize=1)
+def _lookup_ips() -> tuple[str, tuple[str, ...]]:
+    """
+    find the ip of this machine, cached
+
+    read from the network interfaces if `psutil` is installed,
+    skipping those that are down,
+    otherwise resolved from the hostname, which may need a DNS round trip
+
+    `192.168.X.X` ips are placed first, as the robot is expected on that network
+    """
+    if psutil is not None:
+        stats = psutil.net_if_stats()
+        source = "psutil.net_if_addrs"
+        found = [
+            addr.address
+            for name, addrs in psutil.net_if_addrs().items()
+            if name not in stats or stats[name].isup
+            for addr in addrs
+            if addr.family == socket.AF_INET and _usable(addr.address)
+        ]
+    else:
+        hostname = socket.gethostname()
+        if _IS_LINUX:
+            hostname += ".local"
+        source = f"gethostbyname_ex({hostname})"
+        found = socket.gethostbyname_ex(hostname)[2]
+    found.sort(key=lambda ip: not ip.startswith("192.168."))
+    return source, tuple(found)
+
 def auto_detect_ips(logger: Logger | None) -> list[str]:
     """
     try to automatically detect local ip of this machine
@@ -37,17 +81,11 @@ def auto_detect_ips(logger: Logger | None) -> list[str]:
 
     logger.info("No host provided, start detecting host. . .")
 
-    hostname = socket.gethostname()
-    if platform.system() == "Linux":
-        logger.debug("....linux environmnet detected adding \".local\" suffix")
-        hostname += ".local"
-    logger.debug(f"....detected hostname : {hostname}")
-
-    hosts = socket.gethostbyname_ex(hostname)
-    logger.debug(f"....gethostbyname_ex : {hosts}")
+    source, found = _lookup_ips()
+    logger.debug("....detected with %s", source)
 
-    ips : list[str] = hosts[2]
-    logger.info(f"detected ips : {ips}")
+    ips : list[str] = list(found)
+    logger.info("detected ips : %s", ips)
 
     if len(ips) == 0:
         logger.error("No local ip address found")
@@ -61,3 +99,10 @@ def auto_detect_ips(logger: Logger | None) -> list[str]:
         del logger
 
     return ips
+
+def clear_ip_cache():
+    """
+    forget the ip detected by `auto_detect_ips`,
+    so the next call detect them again, e.g. after the network changed
+    """
+    _lookup_ips.cache_clear()
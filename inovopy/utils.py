@@ -6,13 +6,24 @@ This module provide useful functions
 - `clean` : clean up all non visible character of a str
 - `now_str` : return formatted str of current datetime
 - `clamp` : clamp float
+- `json_dumps` : serialize an object to a json str
+- `json_loads` : deserialize a json str or bytes
 """
 import re
+import json
 import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_NON_VISIBLE_RE : re.Pattern = re.compile(r"[^ -~]")
+"""pattern matching any non visible character"""
+
 def clean(s:str) -> str:
     """clean up all non visible characters of a str"""
-    return re.sub(r"[^ -~]", "", s)
+    return _NON_VISIBLE_RE.sub("", s)
 
 def now_str() -> str:
     """
@@ -20,8 +31,29 @@ def now_str() -> str:
 
     e.g. '2024-01-01 12:00:00'
     """
-    return datetime.datetime.now().strftime(r"%Y-%m-%d %Z")
+    return datetime.datetime.now().isoformat(sep=" ", timespec="seconds")
 
 def clamp(f:float, floor:float, ceil:float) -> float:
     """clamp a float between a floor and a ceil"""
-    return min(max(f,floor),ceil)
+    return floor if f < floor else ceil if f > ceil else f
+
+def json_dumps(obj: object) -> str:
+    """
+    serialize an object to a json str
+
+    `orjson` is used if it is installed, which is much faster on small dict,
+    otherwise fall back to the standard `json`
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj)
+
+def json_loads(data: str | bytes) -> object:
+    """
+    deserialize a json str or bytes
+
+    `orjson` is used if it is installed, otherwise fall back to the standard `json`
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
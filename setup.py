@@ -20,7 +20,8 @@ setup(
     long_description_content_type="text/markdown",
     long_description=LONG_DESCRIPTION,
     packages=find_packages(),
-    install_requires=['numpy', 'websockets', 'asyncio', 'nest-asyncio'],
+    install_requires=['numpy', 'websockets', 'asyncio'],
+    extras_require={'fast': ['orjson', 'uvloop; sys_platform != "win32"', 'psutil']},
     keywords=['python', 'robotics', 'inovo robotics', 'inovo robot arm', 'motion', 'sockets'],
     classifiers=[
         "Development Status :: 1 - Planning",